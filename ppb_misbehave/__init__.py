@@ -1,18 +1,29 @@
+import weakref
 from dataclasses import dataclass
-from typing import Any, Callable
+from math import inf
+from time import perf_counter
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Sequence, Tuple
 
 import misbehave
 import ppb
+import ppb.systemslib
 from misbehave.common import BaseNode as Node
 from misbehave.common import State
 from misbehave.decorator import Decorator
+from misbehave.selector import BaseSelector
+from misbehave.selector import ContinuableSelector
 
 
-__all__ = ['Context', 'ThrowEventOnSuccess', 'BehaviorMixin', 'misbehave']
+__all__ = [
+    'Context', 'ThrowEventOnSuccess', 'BehaviorMixin', 'SelfTickingBehaviorMixin',
+    'BehaviorSystem', 'BehaviorScheduler', 'compile_tree',
+    'register_compiler', 'CompiledNode', 'misbehave'
+]
 
 
 @dataclass
 class Context:
+    __slots__ = ("scene", "event", "signal")
     scene: ppb.BaseScene
     event: ppb.events.Update  # TODO: Figure out if this is the right type hint
     signal: Callable[[Any], None]
@@ -32,11 +43,378 @@ class ThrowEventOnSuccess(misbehave.decorator.Decorator):
         return result
 
 
+CompiledNode = Callable[[Any, Context], State]
+compilers: Dict[type, Callable[[Any, Callable[[Node], CompiledNode]], CompiledNode]] = {}
+
+
+def register_compiler(node_type: type):
+    """
+    Register a function that turns nodes of exactly node_type into closures.
+
+    The function receives the node and compile_tree, to compile any children.
+    """
+    def register(function):
+        compilers[node_type] = function
+        return function
+    return register
+
+
+def compile_tree(node: Node) -> CompiledNode:
+    """
+    Flatten a behavior tree into nested closures.
+
+    Node attributes are bound once, so ticking the tree skips the attribute
+    lookups and method dispatch of the original node objects. State kept on
+    the actor (like where a Sequence resumes) uses the same attribute names,
+    so the compiled tree is interchangeable with the original. Node types
+    without a registered compiler are called as they are.
+    """
+    compiler = compilers.get(type(node))
+    if compiler is None:
+        return node
+    return compiler(node, compile_tree)
+
+
+def collect_resets(node: BaseSelector) -> Tuple[List[str], List[Callable[[Any], None]]]:
+    """
+    Find everything BaseSelector.reset would reset, without walking the tree.
+    """
+    attributes = []
+    callbacks = []
+    for child in node.children:
+        if isinstance(child, BaseSelector) and type(child).reset in (BaseSelector.reset, ContinuableSelector.reset):
+            child_attributes, child_callbacks = collect_resets(child)
+            attributes.extend(child_attributes)
+            callbacks.extend(child_callbacks)
+        elif getattr(type(child), "reset", Node.reset) is not Node.reset:
+            callbacks.append(child.reset)
+    if isinstance(node, ContinuableSelector):
+        attributes.append(node.continue_attr)
+    return attributes, callbacks
+
+
+@register_compiler(misbehave.selector.Priority)
+@register_compiler(misbehave.selector.Sequence)
+def compile_continuable(node: ContinuableSelector, compile_child) -> CompiledNode:
+    children = [compile_child(child) for child in node.children]
+    count = len(children)
+    attribute = node.continue_attr
+    stop_states = frozenset(node.stop_states)
+    continue_states = frozenset(node.continue_states)
+    final_state = node.final_state
+    reset_attributes, reset_callbacks = collect_resets(node)
+
+    def continuable(actor, context):
+        new_state = final_state
+        i = 0
+        for i in range(getattr(actor, attribute, 0), count):
+            result = children[i](actor, context)
+            if result in stop_states:
+                new_state = result
+                break
+        if new_state in continue_states:
+            setattr(actor, attribute, i)
+        else:
+            for callback in reset_callbacks:
+                callback(actor)
+            for reset_attribute in reset_attributes:
+                setattr(actor, reset_attribute, 0)
+        return new_state
+    return continuable
+
+
+@register_compiler(misbehave.selector.Concurrent)
+def compile_concurrent(node: misbehave.selector.Concurrent, compile_child) -> CompiledNode:
+    children = [compile_child(child) for child in node.children]
+    num_fail = node.num_fail
+    failed = State.FAILED
+    success = State.SUCCESS
+
+    def concurrent(actor, context):
+        failures = 0
+        all_succeeded = True
+        for child in children:
+            result = child(actor, context)
+            if result is failed:
+                failures += 1
+            if failures >= num_fail:
+                return failed
+            if result is not success:
+                all_succeeded = False
+        return success if all_succeeded else State.RUNNING
+    return concurrent
+
+
+@register_compiler(misbehave.decorator.Decorator)
+def compile_decorator(node: Decorator, compile_child) -> CompiledNode:
+    return compile_child(node.child)
+
+
+@register_compiler(misbehave.decorator.Inverter)
+def compile_inverter(node: misbehave.decorator.Inverter, compile_child) -> CompiledNode:
+    child = compile_child(node.child)
+    inverted = {State.SUCCESS: State.FAILED, State.FAILED: State.SUCCESS}
+
+    def inverter(actor, context):
+        result = child(actor, context)
+        return inverted.get(result, result)
+    return inverter
+
+
+@register_compiler(misbehave.decorator.Debounce)
+def compile_debounce(node: misbehave.decorator.Debounce, compile_child) -> CompiledNode:
+    child = compile_child(node.child)
+    timer = node.timer
+    cool_down = node.cool_down
+    attribute = node.attr
+
+    def debounce(actor, context):
+        if timer() <= getattr(actor, attribute, -10) + cool_down:
+            return State.FAILED
+        result = child(actor, context)
+        if result is State.SUCCESS:
+            setattr(actor, attribute, timer())
+        return result
+    return debounce
+
+
+@register_compiler(misbehave.action.CheckValue)
+def compile_check_value(node: misbehave.action.CheckValue, _) -> CompiledNode:
+    attribute = node.attribute_name
+
+    def check_value(actor, context):
+        return State.SUCCESS if getattr(actor, attribute, None) else State.FAILED
+    return check_value
+
+
+@register_compiler(misbehave.action.SetCurrentTime)
+def compile_set_current_time(node: misbehave.action.SetCurrentTime, _) -> CompiledNode:
+    attribute = node.attribute_name
+    timer = node.timer
+
+    def set_current_time(actor, context):
+        setattr(actor, attribute, timer())
+        return State.SUCCESS
+    return set_current_time
+
+
+@register_compiler(misbehave.action.SetValue)
+def compile_set_value(node: misbehave.action.SetValue, _) -> CompiledNode:
+    attribute = node.attribute_name
+    value = node.value
+
+    def set_value(actor, context):
+        setattr(actor, attribute, value)
+        return State.SUCCESS
+    return set_value
+
+
+@register_compiler(misbehave.action.Wait)
+def compile_wait(node: misbehave.action.Wait, _) -> CompiledNode:
+    attribute = node.attribute_name
+    wait_time = node.wait_time
+    timer = node.timer
+
+    def wait(actor, context):
+        if timer() >= getattr(actor, attribute) + wait_time:
+            return State.SUCCESS
+        return State.RUNNING
+    return wait
+
+
+@register_compiler(misbehave.action.IncreaseValue)
+def compile_increase_value(node: misbehave.action.IncreaseValue, _) -> CompiledNode:
+    attribute = node.attribute_name
+    value = node.value
+
+    def increase_value(actor, context):
+        setattr(actor, attribute, getattr(actor, attribute) + value)
+        return State.SUCCESS
+    return increase_value
+
+
+@register_compiler(misbehave.action.Idle)
+def compile_idle(node: misbehave.action.Idle, _) -> CompiledNode:
+    def idle(actor, context):
+        return State.RUNNING
+    return idle
+
+
+@register_compiler(ThrowEventOnSuccess)
+def compile_throw_event_on_success(node: ThrowEventOnSuccess, compile_child) -> CompiledNode:
+    child = compile_child(node.child)
+    event_type = node.event_type
+    get_event_params = node.get_event_params
+
+    def throw_event_on_success(actor, context):
+        result = child(actor, context)
+        if result is State.SUCCESS:
+            context.signal(event_type(*get_event_params(actor)))
+        return result
+    return throw_event_on_success
+
+
+compiled_trees: MutableMapping[Node, CompiledNode] = weakref.WeakKeyDictionary()
+
+
 class BehaviorMixin(ppb.sprites.BaseSprite):
+    """
+    A sprite driven by a behavior tree.
+
+    Include BehaviorSystem in your systems to tick every actor with a shared
+    Context. The actors have no on_update of their own, so the engine skips
+    them when dispatching Update. Use SelfTickingBehaviorMixin instead for
+    engines without a BehaviorSystem.
+    """
     behavior_tree: Node
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    def tick_behavior(self, context: Context) -> State:
+        tree = self.behavior_tree
+        try:
+            compiled = compiled_trees[tree]
+        except KeyError:
+            compiled = compiled_trees[tree] = compile_tree(tree)
+        return compiled(self, context)
+
+
+class SelfTickingBehaviorMixin(BehaviorMixin):
+    """
+    A BehaviorMixin that ticks itself on Update, as actors did before
+    BehaviorSystem.
+
+    Each tick builds its own Context. If a BehaviorSystem has already ticked
+    the actor for this Update, it does nothing.
+    """
+
+    def on_update(self, event: ppb.events.Update, signal: Callable[[Any], None]):
+        if not getattr(event, "behaviors_ticked", False):
+            self.tick_behavior(Context(event.scene, event, signal))
+
+
+class BehaviorSystem(ppb.systemslib.System):
+    """
+    Ticks every BehaviorMixin in the current scene once per Update.
+
+    Keeps a Context for the current scene and refreshes it in place, instead
+    of each actor building its own on every Update. Marks the Update as
+    handled so SelfTickingBehaviorMixin actors don't tick themselves as well.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.context: Optional[Context] = None
+
+    def on_update(self, event: ppb.events.Update, signal: Callable[[Any], None]):
+        event.behaviors_ticked = True
+        scene = event.scene
+        context = self.context
+        if context is None or context.scene is not scene:
+            context = self.context = Context(scene, event, signal)
+        else:
+            context.event = event
+            context.signal = signal
+        for actor in scene.get(kind=BehaviorMixin):
+            actor.tick_behavior(context)
+
+
+class UpdateView:
+    """
+    An Update event as seen by an actor that missed some frames.
+
+    Reports the time since the actor last ticked, and passes everything else
+    through to the current event.
+    """
+    __slots__ = ("update", "time_delta")
+
+    def __init__(self):
+        self.update = None
+        self.time_delta = 0
+
+    def __getattr__(self, name):
+        return getattr(self.update, name)
+
+
+class BehaviorScheduler(BehaviorSystem):
+    """
+    Ticks distant actors less often and keeps ticks within a time budget.
+
+    An actor ticks every N frames, where N comes from its behavior_interval
+    if set, or else the first of lod_levels whose distance from the camera
+    covers it. Time spent ticking is checked against budget seconds after
+    each actor; once spent, the remaining due actors wait for the next frame,
+    ahead of that frame's own. Actors with a behavior_interval of 1 (like the
+    player) always tick on time, outside the budget. Every tick sees the
+    full time since the actor's last tick as time_delta.
+
+    Pass budget=None to never defer.
+    """
+    lod_levels: Sequence[Tuple[float, int]] = ((12, 1), (24, 2), (inf, 4))
+
+    def __init__(self, *, budget: Optional[float] = 0.004, lod_levels=None,
+                 timer: Callable[[], float] = perf_counter, **kwargs):
+        super().__init__(**kwargs)
+        self.budget = budget
+        if lod_levels is not None:
+            self.lod_levels = lod_levels
+        self.timer = timer
+        self.waiting: Dict[BehaviorMixin, list] = {}  # actor: [time, frames, queued]
+        self.deferred: Dict[BehaviorMixin, None] = {}  # Ordered and without repeats.
+        self.view = UpdateView()
+
+    def interval(self, actor: BehaviorMixin, focus) -> int:
+        interval = getattr(actor, "behavior_interval", None)
+        if interval is not None:
+            return interval
+        distance = (actor.position - focus).length
+        for max_distance, interval in self.lod_levels:
+            if distance <= max_distance:
+                return interval
+        return self.lod_levels[-1][1]
+
     def on_update(self, event: ppb.events.Update, signal: Callable[[Any], None]):
-        self.behavior_tree(self, Context(event.scene, event, signal))
+        event.behaviors_ticked = True
+        scene = event.scene
+        context = self.context
+        if context is None or context.scene is not scene:
+            context = self.context = Context(scene, self.view, signal)
+        context.event = self.view
+        context.signal = signal
+        self.view.update = event
+
+        focus = scene.main_camera.position
+        previous = self.waiting
+        waiting = self.waiting = {}
+        pinned = []
+        queue = self.deferred
+        for actor in scene.get(kind=BehaviorMixin):
+            state = waiting[actor] = previous.get(actor) or [0, 0, False]
+            state[0] += event.time_delta
+            state[1] += 1
+            if getattr(actor, "behavior_interval", None) == 1:
+                pinned.append(actor)
+            elif not state[2] and state[1] >= self.interval(actor, focus):
+                state[2] = True
+                queue[actor] = None
+
+        for actor in pinned:
+            self.tick(actor, waiting[actor], context)
+        start = self.timer()
+        ticked = 0
+        while queue:
+            if ticked and self.budget is not None and self.timer() - start >= self.budget:
+                break
+            actor = next(iter(queue))
+            del queue[actor]
+            state = waiting.get(actor)
+            if state is None:
+                continue  # Left the scene while deferred.
+            self.tick(actor, state, context)
+            ticked += 1
+
+    def tick(self, actor: BehaviorMixin, state: list, context: Context):
+        self.view.time_delta = state[0]
+        state[:] = 0, 0, False
+        actor.tick_behavior(context)
@@ -1,9 +1,87 @@
+from typing import Iterable
+from typing import Optional
+from typing import Type
+
 import ppb
+from ppb.assetlib import AssetLoadingSystem
+from ppb.engine import GameEngine
+from ppb.systems import EventPoller
+from ppb.systems import SoundController
+from ppb.systems import Updater
+from ppb.systemslib import System
+from ppb_misbehave import BehaviorScheduler
 
+from survival import assets
 from survival.sandbox import Sandbox
+from survival.systems import AtlasRenderer
+from survival.systems import AttachmentSystem
+from survival.systems import ClockSystem
 from survival.systems import Controller
 from survival.systems import Collider
+from survival.systems import FixedStep
+from survival.systems import Profiler
+from survival.systems import Recycler
+from survival.systems import TweenSystem
+from survival.systems import WaveSpawner
+
+
+def run(trace_to: Optional[str] = None):
+    """
+    Play the game. If trace_to is given, profile it and save the trace there.
+    """
+    systems = [ClockSystem, Controller, WaveSpawner, TweenSystem, BehaviorScheduler, Collider, Recycler, AttachmentSystem]
+    if trace_to is not None:
+        systems.append(Profiler)
+    ppb.run(
+        starting_scene=Sandbox,
+        basic_systems=[AtlasRenderer, Updater, EventPoller, SoundController, AssetLoadingSystem],
+        systems=systems,
+        preload=assets.preload,
+        title="Survival: Prototype",
+        trace_to=trace_to
+    )
+
+
+def simulate(
+        frames: Optional[int],
+        time_step: float = 1 / 60,
+        systems: Iterable = (),
+        controller: Type[System] = Controller,
+        budget: Optional[float] = None,
+        spawn_budget: Optional[float] = None,
+        **kwargs
+) -> GameEngine:
+    """
+    Run the Sandbox without a window for a number of fixed time steps.
+
+    Runs as fast as the CPU allows, and the same inputs produce the same
+    game. Extra systems (such as scripted input) run after the game's own.
+    Returns the engine, whose current_scene holds the final state.
 
+    Behavior ticks and spawns are never deferred for time unless a budget or
+    spawn_budget is passed.
 
-def run():
-    ppb.run(starting_scene=Sandbox, systems=[Controller, Collider], title="Survival: Prototype")
+    Pass controller=ReplayController and replay_from to play back a recording,
+    with frames=None to run until it ends.
+    """
+    engine = GameEngine(
+        Sandbox,
+        basic_systems=[FixedStep],
+        systems=[
+            ClockSystem,
+            controller,
+            WaveSpawner(spawn_budget=spawn_budget, **kwargs),
+            TweenSystem,
+            BehaviorScheduler(budget=budget, **kwargs),
+            Collider,
+            Recycler,
+            AttachmentSystem,
+            *systems
+        ],
+        frames=frames,
+        time_step=time_step,
+        **kwargs
+    )
+    with engine:
+        engine.run()
+    return engine
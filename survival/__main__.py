@@ -1,3 +1,9 @@
+import argparse
+
 from survival import run
 
-run()
+parser = argparse.ArgumentParser(prog="survival")
+parser.add_argument("--trace", help="Profile every event handler and save a Chrome trace here on exit.")
+args = parser.parse_args()
+
+run(trace_to=args.trace)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from time import perf_counter
+from operator import attrgetter
 from typing import Any
 from typing import cast
 
@@ -11,6 +11,8 @@ from survival import events
 from survival import hitbox
 from survival import utils
 from survival.systems import Controls
+from survival.systems import clock
+from survival.systems import tweens
 
 
 __all__ = ['ControlsMove', 'ChangeFacing', 'BuildCharge', 'CheckButtonControl']
@@ -36,16 +38,25 @@ class CheckButtonControl(bt.common.BaseNode):
             return bt.common.State.FAILED
 
 
+@bt_ppb.register_compiler(CheckButtonControl)
+def compile_check_button_control(node: CheckButtonControl, _) -> bt_ppb.CompiledNode:
+    get_control = attrgetter(node.control_name)
+
+    def check_button_control(actor: Any, context: bt_ppb.Context) -> bt.common.State:
+        if get_control(context.event.controls):
+            return bt.common.State.SUCCESS
+        return bt.common.State.FAILED
+    return check_button_control
+
+
 class ChangeFacing(bt.common.BaseNode):
 
     def __init__(self, percentage=10):
-        self.calculate_rotation = utils.asymptotic_average_builder(percentage)
+        self.amount = percentage / 100.0
 
     def __call__(self, actor: Any, context: bt_ppb.Context) -> bt.common.State:
         if actor.target_facing is not None:
-            actor.facing = self.calculate_rotation(
-                actor.facing, actor.target_facing
-            ).normalize()
+            actor.facing = utils.lerp_direction(actor.facing, actor.target_facing, self.amount)
         return bt.common.State.SUCCESS
 
 
@@ -54,7 +65,7 @@ class ControlsMove(bt.common.BaseNode):
     def __call__(self, actor: Any, context: bt_ppb.Context) -> bt.common.State:
         event: UpdateEvent = cast(UpdateEvent, context.event)
         if event.controls.walk:
-            actor.position += event.controls.walk.scale(actor.speed * event.time_delta)
+            actor.position = utils.move_along(actor.position, event.controls.walk, actor.speed * event.time_delta)
         return bt.common.State.SUCCESS
 
 
@@ -69,24 +80,47 @@ class PrepareDash(bt.common.BaseNode):
 
 
 class DashMove(bt.common.BaseNode):
+    """
+    Moves the actor along its prepared dash, finishing after duration.
+
+    The movement is a tween, so the actor only moves in between while a
+    TweenSystem runs. Without one the dash still ends on time, at its end
+    position. The tween is stopped when the branch resets, so nothing keeps
+    moving the actor after an interrupted dash.
+    """
     duration = 0.25
 
     def __init__(self, start_time_attribute):
         self.start_time_attribute = start_time_attribute
+        self.tween_attribute = f"{start_time_attribute}_tween"
 
     def __call__(self, actor: Any, context: bt_ppb.Context) -> bt.common.State:
-        run_time = perf_counter() - getattr(actor, self.start_time_attribute)
-        if run_time >= self.duration:
-            actor.position = actor.dash_start_position + actor.position_change
-            return bt.common.State.SUCCESS
-        else:
-            actor.position = utils.quadratic_ease_out(
-                run_time,
+        start_time = getattr(actor, self.start_time_attribute)
+        started, tween = getattr(actor, self.tween_attribute, (None, None))
+        if started != start_time:
+            if tween is not None:
+                tweens.stop(tween)
+            tween = tweens.add(
+                actor,
+                "position",
                 actor.dash_start_position,
                 actor.position_change,
-                self.duration
+                self.duration,
+                curve="ease_out",
+                began=start_time
             )
+            setattr(actor, self.tween_attribute, (start_time, tween))
+        if clock() - start_time < self.duration:
             return bt.common.State.RUNNING
+        tweens.stop(tween)
+        actor.position = actor.dash_start_position + actor.position_change
+        return bt.common.State.SUCCESS
+
+    def reset(self, actor):
+        _, tween = getattr(actor, self.tween_attribute, (None, None))
+        if tween is not None:
+            tweens.stop(tween)
+            setattr(actor, self.tween_attribute, (None, None))
 
 
 def Dash(start_time_attribute):
@@ -103,20 +137,25 @@ class SlashHurtBoxArc(bt.common.BaseNode):
         self.change_in_rotation = -80
         self.run_time = .192
         self.start_time_attribute = start_time_attribute
+        self.spawned_attribute = f"{start_time_attribute}_arc_spawned"
         self.distance_offset = 1
         self.size = 1
 
     def __call__(self, actor: Any, context: bt_ppb.Context) -> bt.common.State:
-        run_time = perf_counter() - getattr(actor, self.start_time_attribute)
-        offset = actor.facing.rotate(
-            utils.quadratic_ease_in(
-                run_time,
-                self.initial_rotation,
-                self.change_in_rotation,
-                self.run_time
-            )
-        ).scale_to(self.distance_offset)
-        context.scene.add(hitbox.PlayerHurtBox(position=actor.position + offset, intensity=actor.slash_charge))
+        start_time = getattr(actor, self.start_time_attribute)
+        if getattr(actor, self.spawned_attribute, None) != start_time:
+            setattr(actor, self.spawned_attribute, start_time)
+            context.scene.add(hitbox.SlashArc.acquire(
+                pivot=actor.position,
+                direction=actor.facing,
+                initial_rotation=self.initial_rotation,
+                change_in_rotation=self.change_in_rotation,
+                sweep_time=self.run_time,
+                radius=self.distance_offset,
+                size=self.size,
+                intensity=actor.slash_charge
+            ))
+        run_time = clock() - start_time
         if run_time >= self.run_time:
             return bt.common.State.SUCCESS
         return bt.common.State.RUNNING
@@ -130,7 +169,7 @@ class ReleaseArrow(bt.common.BaseNode):
     def __call__(self, actor: Any, context: bt_ppb.Context) -> bt.common.State:
         target = actor.position + actor.facing.scale(actor.shoot_charge * 1.5 + 2)
         origin = actor.position
-        context.scene.add(hitbox.Arrow(
+        context.scene.add(hitbox.Arrow.acquire(
             target=target,
             origin=origin,
             position=origin,
@@ -146,8 +185,7 @@ def TakeChargeAction(name, action, recovery_time=.016):
     charge_time_start_attr = f"{name}_charge_start_time"
 
     def end_charge_level_params(actor):
-        yield actor
-        yield getattr(actor, charge_name_attr, 0)
+        return actor, getattr(actor, charge_name_attr, 0)
 
     return bt.selector.Sequence(
         bt.decorator.Inverter(CheckButtonControl(name)),
@@ -156,12 +194,12 @@ def TakeChargeAction(name, action, recovery_time=.016):
             event_type=events.ChargeEnded,
             get_event_params=end_charge_level_params
         ),
-        bt.action.SetCurrentTime(start_time_attribute),
+        bt.action.SetCurrentTime(start_time_attribute, timer=clock),
         action(start_time_attribute),
         bt.action.SetValue(charge_time_start_attr, None),
         bt.action.SetValue(charge_name_attr, 0),
-        bt.action.SetCurrentTime("charge_action_recovery"),
-        bt.action.Wait("charge_action_recovery", recovery_time)
+        bt.action.SetCurrentTime("charge_action_recovery", timer=clock),
+        bt.action.Wait("charge_action_recovery", recovery_time, timer=clock)
     )
 
 
@@ -176,34 +214,33 @@ def BuildCharge(action_name, levels) -> bt.common.BaseNode:
     charge_name = f"{action_name}_charge"
 
     def increase_charge_level_params(actor):
-        yield actor
-        yield getattr(actor, charge_name, 0)
+        return actor, getattr(actor, charge_name, 0)
 
     return bt.selector.Sequence(
         bt_ppb.ThrowEventOnSuccess(
-            bt.action.SetCurrentTime(charge_start_name),
+            bt.action.SetCurrentTime(charge_start_name, timer=clock),
             event_type=events.ChargeStarted,
-            get_event_params=lambda a: [a]
+            get_event_params=lambda a: (a,)
         ),
-        bt.action.Wait(charge_start_name, levels[0]),
+        bt.action.Wait(charge_start_name, levels[0], timer=clock),
         bt_ppb.ThrowEventOnSuccess(
             bt.action.IncreaseValue(charge_name),
             event_type=events.IncreasedChargeLevel,
             get_event_params=increase_charge_level_params
         ),
-        bt.action.Wait(charge_start_name, levels[1]),
+        bt.action.Wait(charge_start_name, levels[1], timer=clock),
         bt_ppb.ThrowEventOnSuccess(
             bt.action.IncreaseValue(charge_name),
             event_type=events.IncreasedChargeLevel,
             get_event_params=increase_charge_level_params
         ),
-        bt.action.Wait(charge_start_name, levels[2]),
+        bt.action.Wait(charge_start_name, levels[2], timer=clock),
         bt_ppb.ThrowEventOnSuccess(
             bt.action.IncreaseValue(charge_name),
             event_type=events.IncreasedChargeLevel,
             get_event_params=increase_charge_level_params
         ),
-        bt.action.Wait(charge_start_name, levels[3]),
+        bt.action.Wait(charge_start_name, levels[3], timer=clock),
         bt_ppb.ThrowEventOnSuccess(
             bt.action.IncreaseValue(charge_name),
             event_type=events.IncreasedChargeLevel,
@@ -1,5 +1,14 @@
-from ppb import Image
+from survival.atlas import load_atlas
 
-dead_zombie = Image("survival/resources/dev_art/zombie-body.png")
-player = Image("survival/resources/dev_art/player.png")
-zombie = Image("survival/resources/dev_art/zombie.png")
+regions = load_atlas()
+
+dead_zombie = regions["zombie-body"]
+player = regions["player"]
+zombie = regions["zombie"]
+player_hurt_box = regions["player_hurt_box"]
+enemy_hurt_box = regions["enemy_hurt_box"]
+arrow = regions["arrow"]
+charge_box = regions["charge_box"]
+
+# Loaded before the first frame, so no sprite's first appearance hitches.
+preload = [next(iter(regions.values())).atlas]
@@ -0,0 +1,176 @@
+"""
+Pack the game's images into a single texture atlas.
+
+Every image in dev_art, plus the procedural shapes the hit boxes and debug
+sprites use, is copied into one image with a JSON manifest of where each
+one landed. Sprites then draw from that one texture.
+
+Rebuild after changing dev_art with:
+
+    python -m survival.atlas
+"""
+import ctypes
+import json
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import Tuple
+
+import ppb.vfs
+from ppb import Image
+from ppb.assetlib import AbstractAsset
+from ppb.assets import Square
+from ppb.assets import Triangle
+from sdl2 import SDL_BLENDMODE_NONE
+from sdl2 import SDL_BlitSurface
+from sdl2 import SDL_CreateRGBSurfaceWithFormat
+from sdl2 import SDL_FreeSurface
+from sdl2 import SDL_GetError
+from sdl2 import SDL_PIXELFORMAT_RGBA32
+from sdl2 import SDL_Rect
+from sdl2 import SDL_SetSurfaceBlendMode
+from sdl2.sdlimage import IMG_Load
+from sdl2.sdlimage import IMG_SavePNG
+
+ART_DIRECTORY = Path(__file__).parent / "resources" / "dev_art"
+ATLAS_IMAGE = "survival/resources/dev_art/atlas.png"
+ATLAS_MANIFEST = "survival/resources/dev_art/atlas.json"
+PADDING = 1
+SHAPES = {
+    "player_hurt_box": (Square, (150, 40, 40)),
+    "enemy_hurt_box": (Square, (150, 75, 30)),
+    "arrow": (Triangle, (224, 218, 56)),
+    "charge_box": (Square, (50, 70, 200)),
+}
+
+Rect = Tuple[int, int, int, int]
+
+
+class AtlasRegion(AbstractAsset):
+    """
+    A part of an atlas image, used like any other image.
+
+    load returns the whole atlas, so every region shares its texture; the
+    Renderer draws only rect from it. name is the region's name in the
+    manifest, which is the same in every run.
+    """
+
+    def __init__(self, atlas: Image, rect: Rect, name: str):
+        self.atlas = atlas
+        self.rect = rect
+        self.name = name
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name!r} in {self.atlas.name!r} {self.rect}>"
+
+    def is_loaded(self):
+        return self.atlas.is_loaded()
+
+    def load(self, timeout: float = None):
+        return self.atlas.load(timeout)
+
+
+def load_atlas(manifest: str = ATLAS_MANIFEST) -> Dict[str, AtlasRegion]:
+    """
+    The regions of a built atlas, by the name of the image they came from.
+    """
+    with ppb.vfs.open(manifest) as file:
+        data = json.load(file)
+    atlas = Image(data["image"])
+    return {name: AtlasRegion(atlas, tuple(rect), name) for name, rect in data["regions"].items()}
+
+
+def pack(sizes: Dict[str, Tuple[int, int]], width: int) -> Tuple[Dict[str, Rect], int]:
+    """
+    Place rectangles in rows, tallest first, width pixels wide.
+
+    :return: The rect of each name and the total height.
+    """
+    rects = {}
+    x = y = row_height = 0
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if w > width:
+            raise ValueError(f"{name} is wider than the atlas.")
+        if x + w > width:
+            x = 0
+            y += row_height + PADDING
+            row_height = 0
+        rects[name] = (x, y, w, h)
+        x += w + PADDING
+        row_height = max(row_height, h)
+    return rects, y + row_height
+
+
+def checked_call(function, *args, failed):
+    """
+    Call an SDL or SDL_image function, raising if failed(result) is true.
+    """
+    result = function(*args)
+    if failed(result):
+        raise RuntimeError(f"{function.__name__} failed: {SDL_GetError().decode()}")
+    return result
+
+
+def build_atlas(
+        images: Iterable[Path] = (),
+        shapes=None,
+        image_path: Path = None,
+        manifest_path: Path = None,
+        image_name: str = ATLAS_IMAGE,
+        width: int = 256
+) -> Dict[str, Rect]:
+    """
+    Pack images and shapes into an atlas, writing the image and its manifest.
+
+    Images are named by their file name without the extension. image_name is
+    the path the manifest gives for loading the atlas.
+    """
+    shapes = SHAPES if shapes is None else shapes
+    image_path = image_path or ART_DIRECTORY / "atlas.png"
+    manifest_path = manifest_path or ART_DIRECTORY / "atlas.json"
+
+    surfaces = {}
+    owned = []
+    for path in images:
+        surface = checked_call(IMG_Load, str(path).encode(), failed=lambda result: not result)
+        surfaces[Path(path).stem] = surface
+        owned.append(surface)
+    kept_alive = []
+    for name, (kind, color) in shapes.items():
+        shape = kind(*color)
+        kept_alive.append(shape)
+        surfaces[name] = shape.load()
+
+    rects, height = pack({name: (s.contents.w, s.contents.h) for name, s in surfaces.items()}, width)
+    atlas = checked_call(
+        SDL_CreateRGBSurfaceWithFormat, 0, width, height, 32, SDL_PIXELFORMAT_RGBA32,
+        failed=lambda result: not result
+    )
+    try:
+        for name, surface in surfaces.items():
+            checked_call(SDL_SetSurfaceBlendMode, surface, SDL_BLENDMODE_NONE, failed=lambda result: result < 0)
+            x, y, w, h = rects[name]
+            checked_call(
+                SDL_BlitSurface, surface, None, atlas, ctypes.byref(SDL_Rect(x, y, w, h)),
+                failed=lambda result: result < 0
+            )
+        checked_call(IMG_SavePNG, atlas, str(image_path).encode(), failed=lambda result: result < 0)
+    finally:
+        SDL_FreeSurface(atlas)
+        for surface in owned:
+            SDL_FreeSurface(surface)
+
+    with open(manifest_path, "w") as file:
+        json.dump({"image": image_name, "regions": rects}, file, indent=2, sort_keys=True)
+        file.write("\n")
+    return rects
+
+
+def main():
+    images = sorted(path for path in ART_DIRECTORY.glob("*.png") if path.name != "atlas.png")
+    rects = build_atlas(images)
+    print(f"Packed {len(rects)} images into {ART_DIRECTORY / 'atlas.png'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Run many headless games in parallel and collect their metrics.
+
+Each session plays the Sandbox with seeded random input and a set of player
+tuning values, then reports what happened. Sessions run in a pool of
+worker processes and the results are written as one column per metric to a
+compressed .npz file, ready for numpy or pandas.
+
+    python -m survival.batch --seeds 32 --slash-cool-down .25 .5 1 --out sweep.npz
+
+Charge levels take four times each, and can be repeated to sweep them:
+
+    python -m survival.batch --slash-levels .2 .4 .6 .8 --slash-levels .4 .8 1.2 1.6
+"""
+import argparse
+import inspect
+import os
+import random
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from time import perf_counter
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+import numpy
+from ppb import Vector
+from ppb import buttons as button
+from ppb import events as ppb_events
+from ppb import keycodes as key
+from ppb.systemslib import System
+
+from survival import player
+from survival import simulate
+
+MOVEMENT_KEYS = [key.W, key.A, key.S, key.D]
+ATTACK_BUTTONS = [button.Primary, button.Secondary]
+DEFAULT_SETTINGS = {
+    name: parameter.default
+    for name, parameter in inspect.signature(player.build_behavior_tree).parameters.items()
+}
+SESSION_KEYS = {"seed", "frames", "time_step"}
+
+
+def random_script(seed: int, frames: int) -> Dict[int, List]:
+    """
+    Generate input events for a session, keyed by the frame to signal them on.
+
+    Holds random movement keys, charges attacks for random lengths of time,
+    and aims the mouse around the arena. The same seed always gives the same
+    script.
+    """
+    rng = random.Random(seed)
+    script = defaultdict(list)
+    held = {}  # Ordered, so the same seed gives the same script in any process.
+    frame = 0
+    while frame < frames:
+        for pressed in list(held):
+            if rng.random() < .5:
+                del held[pressed]
+                script[frame].append(ppb_events.KeyReleased(key=pressed, mods=set()))
+        pressed = rng.choice(MOVEMENT_KEYS)
+        if pressed not in held:
+            held[pressed] = None
+            script[frame].append(ppb_events.KeyPressed(key=pressed, mods=set()))
+
+        aim = Vector(rng.uniform(-8, 8), rng.uniform(-8, 8))
+        script[frame].append(ppb_events.MouseMotion(
+            position=aim, screen_position=Vector(0, 0), delta=Vector(0, 0), buttons=set()
+        ))
+        attack = rng.choice(ATTACK_BUTTONS)
+        script[frame].append(ppb_events.ButtonPressed(button=attack, position=aim))
+        frame += rng.randint(5, 60)
+        script[frame].append(ppb_events.ButtonReleased(button=attack, position=aim))
+        frame += rng.randint(5, 30)
+    return script
+
+
+class ScriptedInput(System):
+    """
+    Signals the input events of a script as the frames go by.
+    """
+
+    def __init__(self, *, script: Optional[Dict[int, List]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.script = script or {}
+        self.frame = 0
+
+    def on_update(self, event: ppb_events.Update, signal):
+        for scripted in self.script.get(self.frame, ()):
+            signal(scripted)
+        self.frame += 1
+
+
+class FrameTimer(System):
+    """
+    Records how much wall time each frame took.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.last = None
+        self.frame_times: List[float] = []
+
+    def on_idle(self, event: ppb_events.Idle, signal):
+        now = perf_counter()
+        if self.last is not None:
+            self.frame_times.append(now - self.last)
+        self.last = now
+
+
+def run_session(config: Dict) -> Dict:
+    """
+    Play one headless session and return its metrics.
+
+    config needs a seed and may set frames, time_step and any keyword of
+    survival.player.build_behavior_tree. time_alive is the length of the run
+    until the player can die.
+    """
+    unknown = config.keys() - SESSION_KEYS - DEFAULT_SETTINGS.keys()
+    if unknown:
+        raise ValueError(f"Unknown session settings: {', '.join(sorted(unknown))}")
+    frames = config.get("frames", 3600)
+    settings = {**DEFAULT_SETTINGS, **{k: v for k, v in config.items() if k in DEFAULT_SETTINGS}}
+    engine = simulate(
+        frames,
+        time_step=config.get("time_step", 1 / 60),
+        systems=[ScriptedInput, FrameTimer],
+        script=random_script(config["seed"], frames),
+        scene_kwargs={"player_settings": settings},
+    )
+    scene = engine.current_scene
+    timer = next(system for system in engine.systems if isinstance(system, FrameTimer))
+    frame_times = numpy.array(timer.frame_times or [0.0]) * 1000
+    return {
+        "seed": config["seed"],
+        **settings,
+        "kills": scene.swarm.kills,
+        "enemies_left": len(scene.swarm),
+        "time_alive": engine.clock.now,
+        "mean_frame_ms": float(frame_times.mean()),
+        "max_frame_ms": float(frame_times.max()),
+    }
+
+
+def run_batch(configs: Iterable[Dict], out_path: Optional[str] = None, workers: Optional[int] = None) -> Dict[str, numpy.ndarray]:
+    """
+    Run every config in a pool of worker processes.
+
+    Returns the results as columns, in the order of configs, and saves them
+    to out_path if given.
+    """
+    configs = list(configs)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = list(pool.map(run_session, configs))
+    columns = {name: numpy.array([result[name] for result in results]) for name in results[0]} if results else {}
+    if out_path is not None:
+        numpy.savez_compressed(out_path, **columns)
+    return columns
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seeds", type=int, default=8, help="Sessions per combination of settings.")
+    parser.add_argument("--frames", type=int, default=3600)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default="batch.npz")
+    for name, default in DEFAULT_SETTINGS.items():
+        flag = f"--{name.replace('_', '-')}"
+        if isinstance(default, tuple):
+            parser.add_argument(flag, type=float, nargs=len(default), action="append", metavar="SECONDS")
+        else:
+            parser.add_argument(flag, type=float, nargs="+", default=[default])
+    args = parser.parse_args(argv)
+
+    sweeps = []
+    for name, default in DEFAULT_SETTINGS.items():
+        values = getattr(args, name)
+        if isinstance(default, tuple):
+            values = [tuple(levels) for levels in values] if values else [default]
+        sweeps.append(values)
+    configs = [
+        {"seed": seed, "frames": args.frames, **dict(zip(DEFAULT_SETTINGS, values))}
+        for values in product(*sweeps)
+        for seed in range(args.seeds)
+    ]
+    start = perf_counter()
+    columns = run_batch(configs, args.out, args.workers)
+    print(f"{len(configs)} sessions in {perf_counter() - start:.1f}s, "
+          f"mean kills {columns['kills'].mean():.2f}, written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""
+Benchmarks for the game's hot paths.
+
+Run them with python -m survival.benchmarks. Results are saved as JSON, and
+a run fails if any benchmark is slower than its baseline by more than the
+threshold, even after measuring it again a few times.
+
+Timings depend on the machine, so a baseline only means something on the
+machine that recorded it. Record one with --save-baseline before comparing.
+"""
+from survival.benchmarks.runner import Benchmark
+from survival.benchmarks.runner import Regression
+from survival.benchmarks.runner import benchmark
+from survival.benchmarks.runner import benchmarks
+from survival.benchmarks.runner import compare
+from survival.benchmarks.runner import load_results
+from survival.benchmarks.runner import measure
+from survival.benchmarks.runner import remeasure
+from survival.benchmarks.runner import run_benchmarks
+from survival.benchmarks.runner import save_results
+from survival.benchmarks import cases
@@ -0,0 +1,51 @@
+import argparse
+import sys
+from pathlib import Path
+
+from survival.benchmarks import compare
+from survival.benchmarks import load_results
+from survival.benchmarks import remeasure
+from survival.benchmarks import run_benchmarks
+from survival.benchmarks import save_results
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def report(name, result):
+    print(f"{name:40} {result['seconds'] * 1e6:12.2f} us {result['per_second']:14.1f}/s")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths.")
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks matching this regular expression.")
+    parser.add_argument("--out", help="Save the results to this JSON file.")
+    parser.add_argument("--baseline", default=BASELINE, help="Results to compare against.")
+    parser.add_argument("--threshold", type=float, default=.25, help="Allowed slow down, as a fraction.")
+    parser.add_argument("--retries", type=int, default=2, help="Times to measure a regression again before failing.")
+    parser.add_argument("--save-baseline", action="store_true", help="Replace the baseline with these results.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.pattern, report)
+    regressions = []
+    if args.save_baseline:
+        baseline = load_results(args.baseline) if Path(args.baseline).exists() else {}
+        save_results(args.baseline, {**baseline, **results})
+    elif not Path(args.baseline).exists():
+        print(f"No baseline at {args.baseline}")
+    else:
+        baseline = load_results(args.baseline)
+        regressions = compare(results, baseline, args.threshold)
+        for _ in range(args.retries):
+            if not regressions:
+                break
+            remeasure(results, [regression.name for regression in regressions])
+            regressions = compare(results, baseline, args.threshold)
+    if args.out:
+        save_results(args.out, results)
+    for regression in regressions:
+        print(f"REGRESSION {regression.name}: {regression.ratio:.2f}x baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+from itertools import count
+from math import sqrt
+from random import Random
+from types import SimpleNamespace
+
+from ppb import BaseScene
+from ppb import Vector
+from ppb.events import Update
+from ppb_misbehave import Context
+
+from survival import actions
+from survival import hitbox
+from survival import simulate
+from survival import utils
+from survival.benchmarks.runner import benchmark
+from survival.collection import OrderedCollection
+from survival.culling import CulledScene
+from survival.enemies import Enemy
+from survival.enemies import EnemySwarm
+from survival.flow_field import FlowField
+from survival.player import BTPlayer
+from survival.systems import Collider
+from survival.systems import Controls
+from survival.systems import SpatialHash
+from survival.systems import VectorizedCollider
+from survival.systems import current_clock
+from survival.systems.collider import pack_bounds
+from survival.systems.pooling import get_pool
+from survival.systems.tweening import Tweens
+
+SPRITE_COUNTS = [10, 100, 1000, 5000]
+BRUTE_FORCE_COUNTS = [10, 100]
+SWARM_SIZE = 1000
+HEADLESS_FRAMES = 60
+
+
+class CollisionScene(BaseScene):
+    container_class = OrderedCollection
+    provide_collision = True
+
+    def __init__(self, collision_pairs, **kwargs):
+        super().__init__(**kwargs)
+        self.collision_pairs = collision_pairs
+
+
+def scatter(scene, kind, amount, rng, **kwargs):
+    """
+    Add sprites at random, keeping about two per unit of area at any amount.
+    """
+    half_width = sqrt(amount) / 2
+    for _ in range(amount):
+        position = Vector(rng.uniform(-half_width, half_width), rng.uniform(-half_width, half_width))
+        scene.add(kind(position=position, **kwargs))
+
+
+def collision_benchmark(name, amount, collision_pairs, groups, collider_type=Collider, **collider_kwargs):
+    @benchmark(f"collider.{name}[{amount}]")
+    def setup():
+        rng = Random(amount)
+        scene = CollisionScene(collision_pairs)
+        for kind, share, kwargs in groups:
+            scatter(scene, kind, int(amount * share), rng, **kwargs)
+        collider = collider_type(**collider_kwargs)
+        return lambda: collider.calculate_collision(scene)
+
+
+COLLISION_CASES = [
+    ("same_type", [(Enemy, Enemy)], [(Enemy, 1, {})]),
+    (
+        "cross_type",
+        [(hitbox.PlayerHurtBox, Enemy)],
+        [(Enemy, .5, {}), (hitbox.PlayerHurtBox, .5, {"intensity": 1})]
+    ),
+]
+
+for case_name, case_pairs, case_groups in COLLISION_CASES:
+    for sprite_count in SPRITE_COUNTS:
+        collision_benchmark(case_name, sprite_count, case_pairs, case_groups, broad_phase=SpatialHash())
+        collision_benchmark(f"{case_name}.vectorized", sprite_count, case_pairs, case_groups, VectorizedCollider)
+    # Testing every pair takes minutes past a few hundred sprites.
+    for sprite_count in BRUTE_FORCE_COUNTS:
+        collision_benchmark(f"{case_name}_brute_force", sprite_count, case_pairs, case_groups)
+
+
+def player_context(**controls):
+    scene = BaseScene()
+    player = BTPlayer()
+    scene.add(player)
+    update = Update(1 / 60)
+    update.controls = Controls(**{"walk": Vector(1, 0), "slash": False, "shoot": False, "dash": False, **controls})
+    return player, Context(scene, update, lambda event: None)
+
+
+@benchmark("behavior.player_tick")
+def setup_player_tick():
+    player, context = player_context(slash=True)
+
+    def tick():
+        current_clock().advance(1 / 60)
+        player.tick_behavior(context)
+    return tick
+
+
+@benchmark("swarm.enemy_on_update", units=SWARM_SIZE)
+def setup_enemy_on_update():
+    scene = BaseScene()
+    enemies = [Enemy(position=Vector(x % 40, x // 40)) for x in range(SWARM_SIZE)]
+    for enemy in enemies[::2]:
+        enemy.push_velocity = Vector(1, 1)
+    update = Update(1 / 60, scene)
+
+    def step():
+        for enemy in enemies:
+            enemy.on_update(update, None)
+    return step
+
+
+@benchmark("swarm.update", units=SWARM_SIZE)
+def setup_swarm_update():
+    scene = BaseScene()
+    swarm = EnemySwarm(capacity=SWARM_SIZE)
+    flow_field = FlowField()
+    flow_field.update(Vector(0, 0))
+    for x in range(SWARM_SIZE):
+        handle = swarm.spawn(position=Vector(x % 40 - 20, x // 40 - 12))
+        if x % 2:
+            handle.push_velocity = Vector(1, 1)
+    return lambda: swarm.update(scene, 1 / 60, flow_field)
+
+
+@benchmark("swarm.cull", units=SWARM_SIZE)
+def setup_swarm_cull():
+    scene = CulledScene()
+    swarm = EnemySwarm(capacity=SWARM_SIZE)
+    rng = Random(SWARM_SIZE)
+    for _ in range(SWARM_SIZE):
+        scene.add(swarm.spawn(position=Vector(rng.uniform(-100, 100), rng.uniform(-100, 100))))
+    return lambda: scene.visible_sprites()
+
+
+@benchmark("swarm.enemy_pack_bounds", units=SWARM_SIZE)
+def setup_enemy_pack_bounds():
+    enemies = [Enemy(position=Vector(x % 40, x // 40)) for x in range(SWARM_SIZE)]
+    return lambda: pack_bounds(enemies)
+
+
+@benchmark("swarm.pack_bounds", units=SWARM_SIZE)
+def setup_swarm_pack_bounds():
+    swarm = EnemySwarm(capacity=SWARM_SIZE)
+    handles = [swarm.spawn(position=Vector(x % 40, x // 40)) for x in range(SWARM_SIZE)]
+
+    def pack():
+        swarm.vectors = [None] * len(swarm)  # As after an update, so each position is read fresh.
+        return pack_bounds(handles)
+    return pack
+
+
+@benchmark("slash.spawn_arc")
+def setup_slash_spawn():
+    player, context = player_context()
+    node = actions.SlashHurtBoxArc("slash_start")
+    pool = get_pool(hitbox.SlashArc)
+    starts = count()
+
+    def spawn():
+        player.slash_start = next(starts)
+        node(player, context)
+        arc = next(context.scene.get(kind=hitbox.SlashArc))
+        context.scene.remove(arc)
+        arc.release()
+        pool.recycle()
+    return spawn
+
+
+# Each pair does the same math with chained Vector operations and with the
+# fused helpers in survival.utils.
+VECTOR_CALLS = 10000
+
+
+def vector_benchmark(name, chained, fused):
+    for variant, step in (("chained", chained), ("fused", fused)):
+        @benchmark(f"vector.{name}.{variant}", units=VECTOR_CALLS, repeat=9)
+        def setup(step=step):
+            rng = Random(VECTOR_CALLS)
+            pairs = [
+                (Vector(rng.uniform(-10, 10), rng.uniform(-10, 10)), Vector(rng.uniform(-10, 10), rng.uniform(-10, 10)))
+                for _ in range(VECTOR_CALLS)
+            ]
+            return lambda: [step(first, second) for first, second in pairs]
+
+
+vector_benchmark(
+    "move_toward",
+    lambda position, target: position + (target - position).scale_to(8) * (1 / 60),
+    lambda position, target: utils.move_toward(position, target, 8 * (1 / 60)),
+)
+vector_benchmark(
+    "lerp_direction",
+    lambda facing, target: (facing * .9 + target * .1).normalize(),
+    lambda facing, target: utils.lerp_direction(facing, target, .1),
+)
+vector_benchmark(
+    "advance",
+    lambda position, velocity: position + velocity * (1 / 60),
+    lambda position, velocity: utils.advance(position, velocity, 1 / 60),
+)
+vector_benchmark(
+    "orbit",
+    lambda pivot, direction: pivot + direction.rotate(-20).scale_to(1.5),
+    lambda pivot, direction: utils.orbit(pivot, direction, -20, 1.5),
+)
+
+
+TWEEN_COUNT = 1000
+
+
+@benchmark("tween.per_actor", units=TWEEN_COUNT)
+def setup_tween_per_actor():
+    actors = [SimpleNamespace(start=Vector(x, 0), change=Vector(0, x), began=x / TWEEN_COUNT) for x in range(TWEEN_COUNT)]
+
+    def step():
+        for actor in actors:
+            run_time = min(max(1 - actor.began, 0), 2)
+            actor.position = utils.advance(actor.start, actor.change, utils.quadratic_ease_out(run_time, 0, 1, 2))
+    return step
+
+
+@benchmark("tween.batched", units=TWEEN_COUNT)
+def setup_tween_batched():
+    tweens = Tweens(capacity=TWEEN_COUNT)
+    for x in range(TWEEN_COUNT):
+        tweens.add(SimpleNamespace(), "position", Vector(x, 0), Vector(0, x), 2, curve="ease_out", began=x / TWEEN_COUNT)
+    return lambda: tweens.step(1)
+
+
+@benchmark("headless.sandbox_frame", units=HEADLESS_FRAMES, repeat=3)
+def setup_headless_frames():
+    return lambda: simulate(HEADLESS_FRAMES)
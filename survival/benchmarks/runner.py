@@ -0,0 +1,110 @@
+import json
+import re
+from dataclasses import dataclass
+from timeit import Timer
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# A setup function builds the state for a benchmark and returns the callable
+# to time, which should do units worth of work per call.
+Setup = Callable[[], Callable[[], Any]]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Setup
+    units: int = 1
+    repeat: int = 5
+
+
+@dataclass
+class Regression:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+benchmarks: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, *, units: int = 1, repeat: int = 5) -> Callable[[Setup], Setup]:
+    """
+    Register a setup function as a benchmark.
+    """
+    def register(setup: Setup) -> Setup:
+        benchmarks[name] = Benchmark(name, setup, units, repeat)
+        return setup
+    return register
+
+
+def measure(bench: Benchmark) -> Dict[str, float]:
+    """
+    Time a benchmark, returning the best seconds per unit of work.
+
+    Calls are batched until a batch takes at least a fifth of a second, and
+    the fastest of repeat batches is kept.
+    """
+    timer = Timer(bench.setup())
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=bench.repeat, number=number)) / number
+    seconds = best / bench.units
+    return {"seconds": seconds, "per_second": 1 / seconds, "units": bench.units, "calls": number}
+
+
+def run_benchmarks(pattern: Optional[str] = None, report: Callable[[str, Dict], Any] = None) -> Dict[str, Dict]:
+    """
+    Measure every registered benchmark whose name matches the pattern.
+    """
+    results = {}
+    for name, bench in benchmarks.items():
+        if pattern is not None and not re.search(pattern, name):
+            continue
+        results[name] = measure(bench)
+        if report is not None:
+            report(name, results[name])
+    return results
+
+
+def remeasure(results: Dict[str, Dict], names: List[str]):
+    """
+    Measure the named benchmarks again, keeping the faster of the two results.
+    """
+    for name in names:
+        result = measure(benchmarks[name])
+        if result["seconds"] < results[name]["seconds"]:
+            results[name] = result
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[Regression]:
+    """
+    Find the benchmarks more than threshold slower than their baseline.
+
+    Benchmarks missing from either side are ignored.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]["seconds"]
+        if result["seconds"] > expected * (1 + threshold):
+            regressions.append(Regression(name, expected, result["seconds"]))
+    return regressions
+
+
+def load_results(path) -> Dict[str, Dict]:
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def save_results(path, results: Dict[str, Dict]):
+    with open(path, "w") as file:
+        json.dump({"results": results}, file, indent=2, sort_keys=True)
+        file.write("\n")
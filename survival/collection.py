@@ -0,0 +1,102 @@
+from collections import defaultdict
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from ppb import BaseScene
+from ppb.scenes import GameObjectCollection
+
+
+class OrderedCollection(GameObjectCollection):
+    """
+    A GameObjectCollection that iterates in the order objects were added.
+
+    Set order depends on memory addresses, so it changes between runs. With
+    this the same inputs update, collide and render objects in the same
+    order every time.
+
+    Objects are indexed under every class in their MRO and every tag as they
+    are added and removed. get hands out a snapshot of the index, which is
+    kept until that kind or tag next changes, so repeated lookups in a frame
+    cost nothing.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.all = {}
+        self.kinds = defaultdict(dict)
+        self.tags = defaultdict(dict)
+        self.object_tags: Dict[Hashable, Tuple] = {}
+        self.snapshots: Dict[Tuple, Tuple] = {}
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.snapshot("all", None, self.all))
+
+    def snapshot(self, index: str, key: Hashable, members: dict) -> Tuple:
+        try:
+            return self.snapshots[index, key]
+        except KeyError:
+            snapshot = self.snapshots[index, key] = tuple(members)
+            return snapshot
+
+    def add(self, game_object: Hashable, tags: Iterable[Hashable] = ()) -> None:
+        if isinstance(tags, (str, bytes)):
+            raise TypeError("You passed a string instead of an iterable, this probably isn't what you intended.\n\nTry making it a tuple.")
+        tags = tuple(tags)
+        self.all[game_object] = None
+        self.object_tags[game_object] = self.object_tags.get(game_object, ()) + tags
+        snapshots = self.snapshots
+        snapshots.pop(("all", None), None)
+        for kind in type(game_object).mro():
+            self.kinds[kind][game_object] = None
+            snapshots.pop(("kind", kind), None)
+        for tag in tags:
+            self.tags[tag][game_object] = None
+            snapshots.pop(("tag", tag), None)
+
+    def get(self, *, kind: Type = None, tag: Hashable = None, **_) -> Iterator:
+        if kind is None and tag is None:
+            raise TypeError("get() takes at least one keyword-only argument. 'kind' or 'tag'.")
+        if tag is None:
+            return iter(self.snapshot("kind", kind, self.kinds[kind]))
+        if kind is None:
+            return iter(self.snapshot("tag", tag, self.tags[tag]))
+        kinds = self.kinds[kind]
+        tagged = self.tags[tag]
+        if len(tagged) < len(kinds):
+            return iter([x for x in tagged if x in kinds])
+        return iter([x for x in kinds if x in tagged])
+
+    def first(self, *, kind: Type = None, tag: Hashable = None) -> Optional[Hashable]:
+        """
+        The earliest added object of the kind or tag, or None.
+        """
+        return next(self.get(kind=kind, tag=tag), None)
+
+    def remove(self, game_object: Hashable) -> None:
+        del self.all[game_object]
+        snapshots = self.snapshots
+        snapshots.pop(("all", None), None)
+        for kind in type(game_object).mro():
+            del self.kinds[kind][game_object]
+            snapshots.pop(("kind", kind), None)
+        for tag in self.object_tags.pop(game_object):
+            self.tags[tag].pop(game_object, None)
+            snapshots.pop(("tag", tag), None)
+
+
+class IndexedScene(BaseScene):
+    """
+    A scene whose lookups by kind or tag don't scan every object.
+
+    Uses an OrderedCollection, and adds first for the objects a scene only
+    has one of, like the player or the camera.
+    """
+    container_class = OrderedCollection
+
+    def first(self, *, kind: Type = None, tag: Hashable = None):
+        return self.game_objects.first(kind=kind, tag=tag)
@@ -0,0 +1,149 @@
+from collections import defaultdict
+from math import floor
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+from typing import Type
+
+import numpy
+
+from survival.collection import IndexedScene
+
+# Sprites are squares, so a rotated one reaches out to half its diagonal.
+HALF_DIAGONAL = 0.7072
+
+
+def draw_order(sprite) -> Tuple[float, str]:
+    """
+    Sort by layer, then by image so sprites sharing a texture are drawn together.
+
+    Images are compared by name, so the order is the same in every run.
+    """
+    return getattr(sprite, "layer", 0), getattr(getattr(sprite, "image", None), "name", "")
+
+
+class StaticGrid:
+    """
+    A spatial index of sprites that never move.
+
+    Sprites are bucketed by the cell of their position when added, so finding
+    the ones in a rectangle only visits the cells it covers.
+    """
+
+    def __init__(self, cell_size: float = 4):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Dict] = defaultdict(dict)
+        self.cell_of_sprite: Dict[Hashable, Tuple[int, int]] = {}
+        self.reach = 0.0
+
+    def __len__(self):
+        return len(self.cell_of_sprite)
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def add(self, sprite):
+        cell = self.cell_of(*sprite.position)
+        self.cells[cell][sprite] = None
+        self.cell_of_sprite[sprite] = cell
+        self.reach = max(self.reach, sprite.size * HALF_DIAGONAL)
+
+    def remove(self, sprite):
+        cell = self.cell_of_sprite.pop(sprite)
+        members = self.cells[cell]
+        del members[sprite]
+        if not members:
+            del self.cells[cell]
+
+    def query(self, left: float, right: float, bottom: float, top: float) -> Iterator:
+        reach = self.reach
+        min_x, min_y = self.cell_of(left - reach, bottom - reach)
+        max_x, max_y = self.cell_of(right + reach, top + reach)
+        cells = self.cells
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                members = cells.get((x, y))
+                if members:
+                    yield from members
+
+
+class CulledScene(IndexedScene):
+    """
+    A scene that only hands the renderer what the main camera can see.
+
+    sprite_layers, which ppb's Renderer draws from, skips sprites outside the
+    camera's frame and orders the rest by draw_order. Sprites of
+    static_kinds are kept in a StaticGrid instead of being checked one at a
+    time, so however many pile up, only those near the camera are visited.
+    Sprites whose class sets swarm_member (like SwarmEnemy) are checked a
+    whole swarm at a time, against its positions array. Any other moving
+    sprites are still checked one at a time.
+    """
+    static_kinds: Tuple[Type, ...] = ()
+    static_cell_size = 4
+
+    def __init__(self, **kwargs):
+        self.static_sprites = StaticGrid(self.static_cell_size)
+        self.moving_sprites = {}
+        self.swarm_sprites = {}  # member: its swarm when added
+        self.swarm_reach = {}  # swarm: the largest reach of its members
+        super().__init__(**kwargs)
+
+    def add(self, game_object: Hashable, tags: Iterable = ()) -> None:
+        super().add(game_object, tags)
+        if isinstance(game_object, self.static_kinds):
+            self.static_sprites.add(game_object)
+        elif getattr(type(game_object), "swarm_member", False):
+            swarm = self.swarm_sprites[game_object] = game_object.swarm
+            reach = game_object.size * HALF_DIAGONAL
+            self.swarm_reach[swarm] = max(self.swarm_reach.get(swarm, 0), reach)
+        else:
+            self.moving_sprites[game_object] = None
+
+    def remove(self, game_object: Hashable) -> None:
+        super().remove(game_object)
+        if game_object in self.moving_sprites:
+            del self.moving_sprites[game_object]
+        elif game_object in self.swarm_sprites:
+            del self.swarm_sprites[game_object]
+        else:
+            self.static_sprites.remove(game_object)
+
+    def visible_sprites(self) -> List:
+        camera = self.main_camera
+        left = camera.frame_left
+        right = camera.frame_right
+        bottom = camera.frame_bottom
+        top = camera.frame_top
+        visible = []
+        for sprite in self.static_sprites.query(left, right, bottom, top):
+            x, y = sprite.position
+            reach = sprite.size * HALF_DIAGONAL
+            if left - reach <= x <= right + reach and bottom - reach <= y <= top + reach:
+                visible.append(sprite)
+        for sprite in self.moving_sprites:
+            position = getattr(sprite, "position", None)
+            if position is None:
+                continue
+            x, y = position
+            reach = getattr(sprite, "size", 0) * HALF_DIAGONAL
+            if left - reach <= x <= right + reach and bottom - reach <= y <= top + reach:
+                visible.append(sprite)
+        members = self.swarm_sprites
+        for swarm, reach in self.swarm_reach.items():
+            x, y = swarm.positions[:swarm.count].T
+            inside = (left - reach <= x) & (x <= right + reach) & (bottom - reach <= y) & (y <= top + reach)
+            handles = swarm.handles
+            for index in numpy.flatnonzero(inside).tolist():
+                handle = handles[index]
+                if handle in members:
+                    visible.append(handle)
+        return visible
+
+    def sprite_layers(self) -> Iterator:
+        visible = self.visible_sprites()
+        visible.sort(key=draw_order)
+        return iter(visible)
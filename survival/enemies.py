@@ -1,39 +1,264 @@
-from typing import Union
+from collections import deque
+from typing import Deque
+from typing import List
+from typing import Optional
 
+import numpy
 from ppb import Sprite
+from ppb import Vector
 from ppb.events import Update
 
 from survival.assets import zombie, dead_zombie
+from survival.events import CollisionOngoing
+from survival.events import CollisionStarted
+from survival.flow_field import FlowField
 from survival.hitbox import PlayerHurtBox
+from survival.systems.pooling import Pooled
+from survival.utils import advance
 
 
-class Body(Sprite):
+class Body(Pooled, Sprite):
     image = dead_zombie
     layer = -5
+    pool_capacity = 16
+
+
+class Corpses:
+    """
+    The bodies left in a scene, at most capacity of them.
+
+    Once full, each new body removes and releases the oldest, so however
+    long a session runs the scene holds a fixed number of Body sprites.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self.bodies: Deque[Body] = deque()
+
+    def __len__(self):
+        return len(self.bodies)
+
+    def add(self, scene, position) -> Body:
+        while len(self.bodies) >= self.capacity:
+            oldest = self.bodies.popleft()
+            scene.remove(oldest)
+            oldest.release()
+        body = Body.acquire(position=position)
+        scene.add(body)
+        self.bodies.append(body)
+        return body
+
+
+def leave_body(scene, position):
+    """
+    Add a Body to the scene, through the scene's corpses if it has them.
+    """
+    corpses = getattr(scene, "corpses", None)
+    if corpses is None:
+        scene.add(Body.acquire(position=position))
+    else:
+        corpses.add(scene, position)
 
 
 class Enemy(Sprite):
     image = zombie
+    speed = 1
     dead = False
     push_velocity = None
     stunned = False
 
-    def collided_with(self, other: Union[PlayerHurtBox, 'Enemy']):
+    def on_collision_started(self, event: CollisionStarted, signal):
+        self.touching(event.other)
+
+    def on_collision_ongoing(self, event: CollisionOngoing, signal):
+        self.touching(event.other)
+
+    def touching(self, other):
+        """
+        React to a sprite overlapping this one, every frame they overlap.
+
+        A hurt box still overlapping once an earlier push has worn off
+        pushes again, as it did when collisions were reported every frame.
+        """
         if isinstance(other, PlayerHurtBox):
             if self.push_velocity is None:
-                self.push_velocity = (self.position - other.position).scale_to(other.intensity ** 1.75)
+                self.push_velocity = (self.position - other.push_origin).scale_to(other.intensity ** 1.75)
                 self.stunned = True
         elif isinstance(other, Enemy):
-            if self.stunned and not other.stunned and not other.dead:
-                self.dead = True
+            self.check_knocked_into(other)
+
+    def check_knocked_into(self, other: 'Enemy'):
+        if self.stunned and not other.stunned and not other.dead:
+            self.dead = True
 
     def on_update(self, event: Update, signal):
         if self.dead:
             event.scene.remove(self)
-            event.scene.add(Body(position=self.position))
+            leave_body(event.scene, self.position)
         if self.push_velocity is not None:
-            self.position += self.push_velocity * event.time_delta
+            self.position = advance(self.position, self.push_velocity, event.time_delta)
             self.push_velocity *= .30 ** event.time_delta
             if self.push_velocity.length <= 0.1:
                 self.push_velocity = None
                 self.stunned = False
+
+
+class SwarmEnemy(Enemy):
+    """
+    An Enemy whose state lives in an EnemySwarm.
+
+    Behaves like any other Enemy for rendering and collision, but is stepped
+    by its swarm instead of its own on_update.
+    """
+    on_update = None  # The engine skips objects without a callable handler.
+    swarm_member = True  # pack_bounds reads positions from the swarm directly.
+
+    def __init__(self, *, swarm: 'EnemySwarm', **kwargs):
+        self.swarm = swarm
+        self.index = swarm.allocate(self)
+        super().__init__(**kwargs)
+
+    @property
+    def position(self) -> Vector:
+        swarm, index = self.swarm, self.index
+        vector = swarm.vectors[index]
+        if vector is None:
+            vector = swarm.vectors[index] = Vector(*swarm.positions[index].tolist())
+        return vector
+
+    @position.setter
+    def position(self, value):
+        value = Vector(value)
+        self.swarm.positions[self.index] = value.x, value.y
+        self.swarm.vectors[self.index] = value
+
+    @property
+    def push_velocity(self) -> Optional[Vector]:
+        if not self.swarm.pushed[self.index]:
+            return None
+        return Vector(*self.swarm.push_velocities[self.index].tolist())
+
+    @push_velocity.setter
+    def push_velocity(self, value):
+        if value is None:
+            self.swarm.pushed[self.index] = False
+        else:
+            self.swarm.pushed[self.index] = True
+            self.swarm.push_velocities[self.index] = value.x, value.y
+
+    @property
+    def stunned(self) -> bool:
+        return bool(self.swarm.stunned[self.index])
+
+    @stunned.setter
+    def stunned(self, value):
+        self.swarm.stunned[self.index] = value
+
+    @property
+    def dead(self) -> bool:
+        return bool(self.swarm.dead[self.index])
+
+    @dead.setter
+    def dead(self, value):
+        self.swarm.dead[self.index] = value
+
+
+class EnemySwarm:
+    """
+    Enemy state stored as arrays so every enemy can be stepped at once.
+
+    Create enemies with spawn and call update once per Update. Performs the
+    same steps as Enemy.on_update for every member, and if given a FlowField
+    moves every member that isn't being pushed along it. kills counts the
+    members removed after dying.
+
+    vectors caches each member's position as a Vector until the next update
+    moves them, so the collider and renderer reading a position several
+    times a frame build it only once.
+    """
+    speed = Enemy.speed
+
+    def __init__(self, capacity: int = 64):
+        self.count = 0
+        self.kills = 0
+        self.handles: List[SwarmEnemy] = []
+        self.vectors: List[Optional[Vector]] = []
+        self.positions = numpy.zeros((capacity, 2))
+        self.push_velocities = numpy.zeros((capacity, 2))
+        self.pushed = numpy.zeros(capacity, dtype=bool)
+        self.stunned = numpy.zeros(capacity, dtype=bool)
+        self.dead = numpy.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, **kwargs) -> SwarmEnemy:
+        return SwarmEnemy(swarm=self, **kwargs)
+
+    def allocate(self, handle: SwarmEnemy) -> int:
+        if self.count == len(self.positions):
+            self.grow()
+        index = self.count
+        self.positions[index] = 0
+        self.push_velocities[index] = 0
+        self.pushed[index] = self.stunned[index] = self.dead[index] = False
+        self.handles.append(handle)
+        self.vectors.append(None)
+        self.count += 1
+        return index
+
+    def grow(self):
+        capacity = max(1, len(self.positions) * 2)
+        for name in ("positions", "push_velocities", "pushed", "stunned", "dead"):
+            old = getattr(self, name)
+            new = numpy.zeros((capacity, *old.shape[1:]), dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def remove(self, handle: SwarmEnemy):
+        """
+        Remove a member, moving the last member into its slot.
+
+        The removed handle keeps its final state in a swarm of its own.
+        """
+        orphan = EnemySwarm(capacity=1)
+        orphan.allocate(handle)
+        index, last = handle.index, self.count - 1
+        for name in ("positions", "push_velocities", "pushed", "stunned", "dead"):
+            array = getattr(self, name)
+            getattr(orphan, name)[0] = array[index]
+            array[index] = array[last]
+        orphan.vectors[0] = self.vectors[index]
+        self.vectors[index] = self.vectors[last]
+        self.vectors.pop()
+        moved = self.handles.pop()
+        if moved is not handle:
+            self.handles[index] = moved
+            moved.index = index
+        self.count -= 1
+        handle.swarm = orphan
+        handle.index = 0
+
+    def update(self, scene, time_delta: float, flow_field: Optional[FlowField] = None):
+        for index in numpy.flatnonzero(self.dead[:self.count])[::-1]:
+            handle = self.handles[index]
+            scene.remove(handle)
+            leave_body(scene, handle.position)
+            self.remove(handle)
+            self.kills += 1
+
+        count = self.count
+        pushed = self.pushed[:count]
+        stunned = self.stunned[:count]
+        positions = self.positions[:count]
+        velocities = self.push_velocities[:count]
+        self.vectors = [None] * count  # Every cached position may be moving.
+        positions[pushed] += velocities[pushed] * time_delta
+        velocities[pushed] *= .30 ** time_delta
+        stopped = pushed & (numpy.hypot(velocities[:, 0], velocities[:, 1]) <= 0.1)
+        pushed[stopped] = False
+        stunned[stopped] = False
+
+        if flow_field is not None:
+            chasing = ~(pushed | stunned)
+            positions[chasing] += flow_field.directions_at(positions[chasing]) * (self.speed * time_delta)
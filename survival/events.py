@@ -17,3 +17,21 @@ class ChargeEnded:
 class IncreasedChargeLevel:
     actor: Any
     level: int
+
+
+@dataclass
+class CollisionStarted:
+    other: Any
+    scene: Any = None
+
+
+@dataclass
+class CollisionOngoing:
+    other: Any
+    scene: Any = None
+
+
+@dataclass
+class CollisionEnded:
+    other: Any
+    scene: Any = None
@@ -1,11 +1,14 @@
 from dataclasses import dataclass
-from time import monotonic
 from typing import Tuple
 
 from ppb import Vector
 from ppb import Sprite
-from ppb import Square
-from ppb import Triangle
+
+from survival import assets
+from survival import utils
+from survival.systems.clock import clock
+from survival.systems.pooling import Pooled
+from survival.systems.tweening import tweens
 
 
 @dataclass
@@ -19,38 +22,109 @@ class HitBox:
     definition: Tuple[Vector, Vector]
 
 
-class HurtBox(Sprite):
-    image = Square(150, 40, 40)
+class HurtBox(Pooled, Sprite):
+    image = assets.player_hurt_box
     life_span = .20  # TODO: CONFIG
     layer = -10
     intensity = 1
+    pool_capacity = 8
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.start = monotonic()
+        self.start = clock()
 
     def on_update(self, event, _):
-        if monotonic() >= self.start + self.life_span:
+        if clock() >= self.start + self.life_span:
             event.scene.remove(self)
+            self.release()
+
+    @property
+    def push_origin(self) -> Vector:
+        """
+        Where enemies hit by this are pushed away from.
+        """
+        return self.position
 
 
 class PlayerHurtBox(HurtBox):
-    image = Square(150, 40, 40)
+    image = assets.player_hurt_box
 
 
 class EnemyHurtBox(HurtBox):
-    image = Square(150, 75, 30)
+    image = assets.enemy_hurt_box
 
 
 class Arrow(PlayerHurtBox):
-    image = Triangle(224, 218, 56)
+    image = assets.arrow
     target = Vector(0, 4)
     origin = Vector(0, 0)
     speed = 8
     size = 0.25
     layer = 20
+    swept = True  # Tested along its whole path so fast arrows can't tunnel.
+
+    def on_update(self, event, _):
+        self.position = utils.move_toward(self.position, self.target, self.speed * event.time_delta)
+        if utils.distance(self.origin, self.target) <= utils.distance(self.origin, self.position):
+            event.scene.remove(self)
+            self.release()
+
+
+class SlashArc(PlayerHurtBox):
+    """
+    A single hurt shape that sweeps around pivot over sweep_time.
+
+    Covers the same ground as spawning a HurtBox along the arc every frame:
+    each part of the arc stays active for life_span after the sweep passes
+    it. position follows the leading edge.
+
+    Both edges are tweened, so the sweep needs a TweenSystem. The tweens
+    start in acquire rather than __init__, so the idle arcs a pool
+    preallocates don't sweep.
+    """
+    hit_shape = "arc"
+    pivot = Vector(0, 0)
+    direction = Vector(0, 1)
+    initial_rotation = 60
+    change_in_rotation = -80
+    sweep_time = .192
+    radius = 1
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.start_angle = self.end_angle = self.initial_rotation
+        self.position = self.point_at(self.initial_rotation)
+
+    @classmethod
+    def acquire(cls, **kwargs):
+        arc = super().acquire(**kwargs)
+        for attribute, began in (("end_angle", arc.start), ("start_angle", arc.start + arc.life_span)):
+            tweens.add(
+                arc,
+                attribute,
+                arc.initial_rotation,
+                arc.change_in_rotation,
+                arc.sweep_time,
+                curve="ease_in",
+                began=began
+            )
+        return arc
+
+    def release(self):
+        tweens.cancel(self)
+        super().release()
+
+    def point_at(self, angle):
+        return utils.orbit(self.pivot, self.direction, angle, self.radius)
+
+    @property
+    def push_origin(self) -> Vector:
+        return self.pivot
 
     def on_update(self, event, _):
-        self.position += (self.target - self.position).scale_to(self.speed) * event.time_delta
-        if (self.target - self.origin).length <= (self.origin - self.position).length:
+        run_time = clock() - self.start
+        if run_time >= self.sweep_time + self.life_span:
             event.scene.remove(self)
+            self.release()
+            return
+        self.position = self.point_at(self.end_angle)
@@ -4,13 +4,15 @@ from misbehave import decorator
 from misbehave import selector
 from ppb import Sprite
 from ppb import Vector
-from ppb.assets import Square
 import ppb_misbehave as bt_pbb
 
 from survival import actions
 from survival import events
 from survival import utils
+from survival.assets import charge_box
 from survival.assets import player
+from survival.systems import Attached
+from survival.systems import clock
 
 calculate_rotation = utils.asymptotic_average_builder(12)
 
@@ -36,52 +38,42 @@ DASH_COOL_DOWN = 0.75
 FACING_NEW_PART_PERCENT = 12
 
 
-class BTPlayer(Sprite, bt_pbb.BehaviorMixin):
-    image = player
-    basis = Vector(0, 1)
-    speed = 3
-    target_facing = None
-    slash_charge_levels = [
-        SLASH_LEVEL_1_TIME,
-        SLASH_LEVEL_2_TIME,
-        SLASH_LEVEL_3_TIME,
-        SLASH_LEVEL_4_TIME
-    ]
-    slash_charge = 0
-    shoot_charge_levels = [
-        SHOOT_LEVEL_1_TIME,
-        SHOOT_LEVEL_2_TIME,
-        SHOOT_LEVEL_3_TIME,
-        SHOOT_LEVEL_4_TIME
-    ]
-    shoot_charge = 0
-    dash_charge_levels = [
-        DASH_LEVEL_1_TIME,
-        DASH_LEVEL_2_TIME,
-        DASH_LEVEL_3_TIME,
-        DASH_LEVEL_4_TIME
-    ]
-    dash_charge = 0
-    behavior_tree = bt.selector.Priority(
+def build_behavior_tree(
+        slash_levels=(SLASH_LEVEL_1_TIME, SLASH_LEVEL_2_TIME, SLASH_LEVEL_3_TIME, SLASH_LEVEL_4_TIME),
+        slash_cool_down=SLASH_COOL_DOWN,
+        shoot_levels=(SHOOT_LEVEL_1_TIME, SHOOT_LEVEL_2_TIME, SHOOT_LEVEL_3_TIME, SHOOT_LEVEL_4_TIME),
+        shoot_cool_down=SHOOT_COOL_DOWN,
+        dash_levels=(DASH_LEVEL_1_TIME, DASH_LEVEL_2_TIME, DASH_LEVEL_3_TIME, DASH_LEVEL_4_TIME),
+        dash_cool_down=DASH_COOL_DOWN,
+) -> bt.common.BaseNode:
+    """
+    Build the player's behavior tree.
+
+    Defaults to the tuning constants above. Pass other charge times and cool
+    downs to try them out, like survival.batch does.
+    """
+    return bt.selector.Priority(
         bt.decorator.Debounce(
             bt.selector.Priority(
                 actions.TakeChargeAction("dash", actions.Dash),
                 bt.selector.Concurrent(
                     actions.CheckButtonControl("dash"),
-                    actions.BuildCharge("dash", dash_charge_levels)
+                    actions.BuildCharge("dash", dash_levels)
                 )
             ),
-            delay=DASH_COOL_DOWN
+            delay=dash_cool_down,
+            timer=clock
         ),
         bt.decorator.Debounce(
             bt.selector.Priority(
                 actions.TakeChargeAction("slash", actions.SlashHurtBoxArc),
                 bt.selector.Concurrent(  # Build a slash charge
                     actions.CheckButtonControl("slash"),
-                    actions.BuildCharge("slash", slash_charge_levels)
+                    actions.BuildCharge("slash", slash_levels)
                 ),
             ),
-            delay=SLASH_COOL_DOWN
+            delay=slash_cool_down,
+            timer=clock
         ),
         bt.decorator.Debounce(
             bt.selector.Priority(
@@ -89,10 +81,11 @@ class BTPlayer(Sprite, bt_pbb.BehaviorMixin):
                 bt.selector.Concurrent(
                     actions.CheckButtonControl("shoot"),
                     actions.CheckButtonControl("shoot"),
-                    actions.BuildCharge("shoot", shoot_charge_levels)
+                    actions.BuildCharge("shoot", shoot_levels)
                 ),
             ),
-            delay=SHOOT_COOL_DOWN
+            delay=shoot_cool_down,
+            timer=clock
         ),
         bt.selector.Sequence(
             actions.ControlsMove(),
@@ -100,36 +93,77 @@ class BTPlayer(Sprite, bt_pbb.BehaviorMixin):
         )
     )
 
+
+class BTPlayer(Sprite, bt_pbb.BehaviorMixin):
+    image = player
+    basis = Vector(0, 1)
+    speed = 3
+    target_facing = None
+    behavior_interval = 1  # Always responsive to input.
+    slash_charge_levels = [
+        SLASH_LEVEL_1_TIME,
+        SLASH_LEVEL_2_TIME,
+        SLASH_LEVEL_3_TIME,
+        SLASH_LEVEL_4_TIME
+    ]
+    slash_charge = 0
+    shoot_charge_levels = [
+        SHOOT_LEVEL_1_TIME,
+        SHOOT_LEVEL_2_TIME,
+        SHOOT_LEVEL_3_TIME,
+        SHOOT_LEVEL_4_TIME
+    ]
+    shoot_charge = 0
+    dash_charge_levels = [
+        DASH_LEVEL_1_TIME,
+        DASH_LEVEL_2_TIME,
+        DASH_LEVEL_3_TIME,
+        DASH_LEVEL_4_TIME
+    ]
+    dash_charge = 0
+    behavior_tree = build_behavior_tree()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.charge_boxes = []
+
     def on_mouse_motion(self, event, signal):
         self.target_facing = (
                 event.position - self.position
         ).normalize()
 
+    def on_increased_charge_level(self, event: events.IncreasedChargeLevel, _):
+        for box in self.charge_boxes:
+            if event.level >= box.value:
+                box.active = True
+
+    def on_charge_ended(self, _: events.ChargeEnded, __):
+        for box in self.charge_boxes:
+            box.active = False
+
+
+class ChargeBox(Attached, Sprite):
+    """
+    Temporary debug item.
 
-class ChargeBox(Sprite):
-    """Temporary debug item."""
+    Adds itself to its parent's charge_boxes, which light up as charge builds.
+    """
     parent: 'BTPlayer'
     value: int = 4
     idle_image = None
-    active_image = Square(50, 70, 200)
+    active_image = charge_box
     active = False
     offsets = [1, 0.33, -0.33, -1]  # These are magic and modified by eye.
     size = 0.25
     layer = 20
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A row behind the parent, 0.8 back and spread 0.4 to either side.
+        self.offset = Vector(-0.4 * self.offsets[self.value - 1], -0.8)
+        if self.parent is not None:
+            self.parent.charge_boxes.append(self)
+
     @property
     def image(self):
         return self.active_image if self.active else self.idle_image
-
-    def on_pre_render(self, _, __):
-        behind = self.parent.facing * -0.8
-        home = behind.rotate(-90).scale(0.40)
-        self.position = self.parent.position + behind + (home * self.offsets[self.value - 1])
-        self.facing = self.parent.facing
-
-    def on_increased_charge_level(self, event: events.IncreasedChargeLevel, _):
-        if event.level >= self.value:
-            self.active = True
-
-    def on_charge_ended(self, _: events.ChargeEnded, __):
-        self.active = False
@@ -1,31 +1,51 @@
-from ppb import BaseScene
-
+from survival.culling import CulledScene
+from survival.enemies import Body
+from survival.enemies import Corpses
 from survival.enemies import Enemy
+from survival.enemies import EnemySwarm
+from survival.flow_field import FlowField
 from survival.hitbox import PlayerHurtBox
 from survival.player import BTPlayer as Player
+from survival.player import build_behavior_tree
 from survival.player import ChargeBox
-from survival.utils import asymptotic_average_builder
+from survival.systems.waves import escalating_waves
+from survival.utils import lerp_builder
 
 
-calc_cam_pos = asymptotic_average_builder(5)
+calc_cam_pos = lerp_builder(5)
 
 
-class Sandbox(BaseScene):
+class Sandbox(CulledScene):
     background_color = 0, 0, 0
     provide_collision = True
+    track_contacts = True
     collision_pairs = [(PlayerHurtBox, Enemy), (Enemy, Enemy)]
+    waves = escalating_waves()
+    static_kinds = (Body,)
 
-    def __init__(self, **kwargs):
+    def __init__(self, *, player_settings=None, **kwargs):
         super().__init__(pixel_ration=32, **kwargs)
-        player = Player()
+        self.swarm = EnemySwarm()
+        self.flow_field = FlowField()
+        self.corpses = Corpses()
+        if player_settings:
+            player = Player(behavior_tree=build_behavior_tree(**player_settings))
+        else:
+            player = Player()
+        self.player = player
         self.add(player)
         for x in range(1, 5):
             self.add(ChargeBox(parent=player, value=x))
-        for x in range(2, 11, 2):
-            self.add(Enemy(position=(0, x)), tags=["enemy"])
+
+    def spawn_enemy(self, position):
+        self.add(self.swarm.spawn(position=position), tags=["enemy"])
+
+    def on_update(self, event, signal):
+        self.flow_field.update(self.player.position)
+        self.swarm.update(self, event.time_delta, self.flow_field)
 
     def on_pre_render(self, event, signal):
-        player = next(self.get(kind=Player))
+        player = self.first(kind=Player)
         camera = self.main_camera
 
         camera.position = calc_cam_pos(camera.position, player.position)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from ppb import buttons as button
 from ppb import events as ppb_events
@@ -7,10 +8,36 @@ from ppb import Vector
 from ppb.engine import GameEngine
 from ppb.systemslib import System
 
+from survival.systems.attachments import Attached
+from survival.systems.attachments import AttachmentSystem
+from survival.systems.clock import ClockSystem
+from survival.systems.clock import clock
+from survival.systems.clock import current_clock
 from survival.systems.collider import Collider
+from survival.systems.collider import SpatialHash
+from survival.systems.collider import VectorizedCollider
+from survival.systems.headless import FixedStep
+from survival.systems.pooling import Pooled
+from survival.systems.pooling import Recycler
+from survival.systems.profiler import Profiler
+from survival.systems.recording import ControlsReader
+from survival.systems.recording import ControlsState
+from survival.systems.recording import ControlsWriter
+from survival.systems.rendering import AtlasRenderer
+from survival.systems.tweening import TweenSystem
+from survival.systems.tweening import tweens
+from survival.systems.waves import Wave
+from survival.systems.waves import WaveSpawner
 
 
 class Controls:
+    """
+    An immutable snapshot of the player's input.
+
+    The Controller only builds a new one when the input changes, so the same
+    instance is shared by every event until then.
+    """
+    __slots__ = ("walk", "slash", "shoot", "dash")
 
     def __init__(self, walk: Vector, slash: bool, shoot: bool, dash: bool):
         """
@@ -18,10 +45,14 @@ class Controls:
         :param walk: A vector with the X value of [-1, 1] and y value of
         [-1, 1]
         """
-        self.walk = walk
-        self.slash = slash
-        self.shoot = shoot
-        self.dash = dash
+        set_attribute = super().__setattr__
+        set_attribute("walk", walk)
+        set_attribute("slash", slash)
+        set_attribute("shoot", shoot)
+        set_attribute("dash", dash)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
 
 class Controller(System):
@@ -33,15 +64,32 @@ class Controller(System):
 
     def __init__(self, *, engine: GameEngine, **kwargs):
         super().__init__(**kwargs)
-        engine.register(..., self.add_controls)
+        self.controls = Controls(Vector(0, 0), False, False, False)
+        for event_type in CONTROLLED_EVENTS:
+            engine.register(event_type, self.add_controls)
 
     def add_controls(self, event):
-        event.controls = Controls(
-            walk=Vector(self.horizontal, self.vertical),
-            slash=self.slash,
-            shoot=self.shoot,
-            dash=self.dash
-        )
+        event.controls = self.controls
+
+    def refresh(self):
+        """
+        Replace the Controls snapshot if the input has changed.
+        """
+        controls = self.controls
+        walk = controls.walk
+        if (
+                walk.x != self.horizontal
+                or walk.y != self.vertical
+                or controls.slash != self.slash
+                or controls.shoot != self.shoot
+                or controls.dash != self.dash
+        ):
+            self.controls = Controls(
+                walk=Vector(self.horizontal, self.vertical),
+                slash=self.slash,
+                shoot=self.shoot,
+                dash=self.dash
+            )
 
     def on_key_pressed(self, event: ppb_events.KeyPressed, signal):
         if event.key is key.W:
@@ -54,6 +102,7 @@ class Controller(System):
             self.horizontal += 1
         elif event.key is key.Space:
             self.dash = True
+        self.refresh()
 
     def on_key_released(self, event: ppb_events.KeyReleased, signal):
         if event.key is key.W:
@@ -66,12 +115,14 @@ class Controller(System):
             self.horizontal += -1
         elif event.key is key.Space:
             self.dash = False
+        self.refresh()
 
     def on_button_pressed(self, event: ppb_events.ButtonPressed, signal):
         if event.button is button.Primary:
             self.slash = True
         elif event.button is button.Secondary:
             self.shoot = True
+        self.refresh()
 
     def on_button_released(self, event: ppb_events.ButtonReleased, signal):
         if event.button is button.Primary:
@@ -79,6 +130,87 @@ class Controller(System):
             signal(SlashRequested())
         elif event.button is button.Secondary:
             self.shoot = False
+        self.refresh()
+
+
+class ControlsRecorder(System):
+    """
+    Streams the Controls of every Update to the file at record_to.
+
+    Replay the file with ReplayController.
+    """
+
+    def __init__(self, *, record_to: Optional[str] = None, time_step: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.record_to = record_to
+        self.time_step = time_step
+        self.writer = None
+
+    def __enter__(self):
+        if self.record_to is not None:
+            self.writer = ControlsWriter(open(self.record_to, "wb"), self.time_step)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    def on_update(self, event: ppb_events.Update, signal):
+        if self.writer is None:
+            return
+        controls = event.controls
+        self.writer.write(ControlsState(
+            controls.walk.x,
+            controls.walk.y,
+            controls.slash,
+            controls.shoot,
+            controls.dash
+        ))
+
+
+class ReplayController(Controller):
+    """
+    A Controller that plays back a recording instead of live input.
+
+    Use it in place of Controller. Each Update takes the next tick from the
+    file at replay_from, which is read as the game goes. Signals Quit when
+    the recording runs out.
+    """
+    on_key_pressed = None
+    on_key_released = None
+    on_button_pressed = None
+    on_button_released = None
+    slash_released = False
+
+    def __init__(self, *, engine: GameEngine, replay_from: str, **kwargs):
+        super().__init__(engine=engine, **kwargs)
+        self.replay_from = replay_from
+        self.reader = None
+        self.ticks = None
+        self.upcoming = None
+
+    def __enter__(self):
+        self.reader = ControlsReader(open(self.replay_from, "rb"))
+        self.ticks = iter(self.reader)
+        self.upcoming = next(self.ticks, None)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.reader.close()
+
+    def add_controls(self, event):
+        if isinstance(event, ppb_events.Update) and self.upcoming is not None:
+            self.horizontal, self.vertical, slash, self.shoot, self.dash = self.upcoming
+            self.slash_released = self.slash and not slash
+            self.slash = slash
+            self.upcoming = next(self.ticks, None)
+            self.refresh()
+        super().add_controls(event)
+
+    def on_update(self, event: ppb_events.Update, signal):
+        if self.slash_released:
+            signal(SlashRequested())
+        if self.upcoming is None:
+            signal(ppb_events.Quit())
 
 
 @dataclass
@@ -115,3 +247,15 @@ class ChargeSlash:
 class SlashRequested:
     scene = None
     controls: Controls = None
+
+
+# The events that carry a Controls snapshot.
+CONTROLLED_EVENTS = (
+    ppb_events.Update,
+    DrawBow,
+    ReleaseBow,
+    ChargeDash,
+    DashRequested,
+    ChargeSlash,
+    SlashRequested,
+)
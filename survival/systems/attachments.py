@@ -0,0 +1,72 @@
+from typing import Any
+from typing import List
+
+import numpy
+from ppb import Vector
+from ppb.events import PreRender
+from ppb.systemslib import System
+
+
+class Attached:
+    """
+    Mixin for sprites that ride along with a parent.
+
+    offset is in the parent's frame: y points along the parent's facing and
+    x to its right. AttachmentSystem places every attached sprite once per
+    frame, so children don't need an on_pre_render of their own.
+
+    Set follow_facing to False to keep the child's own facing.
+    """
+    parent: Any = None
+    offset: Vector = Vector(0, 0)
+    follow_facing = True
+
+
+def resolve(children: List[Attached]):
+    """
+    Place children one at a time.
+    """
+    for child in children:
+        parent = child.parent
+        forward = parent.facing
+        right = Vector(forward.y, -forward.x)
+        offset = child.offset
+        child.position = parent.position + right * offset.x + forward * offset.y
+        if child.follow_facing:
+            child.facing = forward
+
+
+def resolve_vectorized(children: List[Attached]):
+    """
+    Place children with the math done in arrays.
+    """
+    parents = [child.parent for child in children]
+    positions = numpy.array([tuple(parent.position) for parent in parents])
+    forward = numpy.array([tuple(parent.facing) for parent in parents])
+    offsets = numpy.array([tuple(child.offset) for child in children])
+    right = numpy.stack([forward[:, 1], -forward[:, 0]], axis=1)
+    placed = positions + right * offsets[:, :1] + forward * offsets[:, 1:]
+    for child, (x, y), parent in zip(children, placed.tolist(), parents):
+        child.position = Vector(x, y)
+        if child.follow_facing:
+            child.facing = parent.facing
+
+
+class AttachmentSystem(System):
+    """
+    Moves every Attached sprite to its parent before rendering.
+
+    Scenes with at least vectorize_at attached sprites are resolved with
+    numpy in one pass.
+    """
+
+    def __init__(self, *, vectorize_at: int = 32, **kwargs):
+        super().__init__(**kwargs)
+        self.vectorize_at = vectorize_at
+
+    def on_pre_render(self, event: PreRender, signal):
+        children = [child for child in event.scene.get(kind=Attached) if child.parent is not None]
+        if len(children) >= self.vectorize_at:
+            resolve_vectorized(children)
+        elif children:
+            resolve(children)
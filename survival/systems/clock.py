@@ -0,0 +1,73 @@
+from contextvars import ContextVar
+
+from ppb.events import Update
+from ppb.systemslib import System
+
+
+class SimulationClock:
+    """
+    Game time in seconds, advanced by Update events instead of the wall clock.
+
+    Call it to read the current time.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, time_delta: float):
+        self.now += time_delta
+
+
+# Read outside of any engine, such as in unit tests and benchmarks.
+idle_clock = SimulationClock()
+running_clock: ContextVar[SimulationClock] = ContextVar("running_clock")
+
+
+def current_clock() -> SimulationClock:
+    """
+    The clock of the engine being updated.
+    """
+    return running_clock.get(idle_clock)
+
+
+def clock() -> float:
+    """
+    The time on the clock of the engine being updated.
+
+    Takes no arguments, so it can be used as the timer of misbehave nodes,
+    which are built once and shared by every engine.
+    """
+    return running_clock.get(idle_clock).now
+
+
+class ClockSystem(System):
+    """
+    Owns an engine's simulation clock and advances it on every Update.
+
+    The clock is engine.clock, and each Update carries the time as now.
+    While the engine runs, clock() reads this clock, so engines in the same
+    process keep their own time.
+
+    Must come before any other system that handles Update.
+    """
+
+    def __init__(self, *, engine=None, **kwargs):
+        super().__init__(**kwargs)
+        self.clock = SimulationClock()
+        if engine is not None:
+            engine.clock = self.clock
+        self.token = None
+
+    def __enter__(self):
+        self.token = running_clock.set(self.clock)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        running_clock.reset(self.token)
+
+    def on_update(self, event: Update, _):
+        running_clock.set(self.clock)
+        self.clock.advance(event.time_delta)
+        event.now = self.clock.now
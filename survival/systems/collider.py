@@ -1,20 +1,35 @@
+import weakref
+from collections import defaultdict
 from dataclasses import dataclass
+from dataclasses import field
+from itertools import chain
 from itertools import combinations
 from itertools import product
+from math import floor
+from typing import Any
+from typing import Dict
+from typing import Optional
 from typing import Set
 from typing import Tuple
 
+import numpy
 from ppb import Sprite
 from ppb.events import Idle
 from ppb.events import SceneContinued
 from ppb.events import SceneStarted
 from ppb.systemslib import System
 
+from survival import events
+
 
 @dataclass
 class SceneCollisionsDefinition:
     requires: Set[type]
     pairs: Set[Tuple[type, type]]
+    track_contacts: bool = False
+    contacts: Dict[frozenset, Tuple[Any, Any]] = field(default_factory=dict)
+    last_seen: Dict[Any, Tuple[Any, float]] = field(default_factory=dict)
+    swept_positions: Dict[Any, Any] = field(default_factory=dict)
 
 
 def does_collide_default(left_sprite, right_sprite):
@@ -25,6 +40,90 @@ def does_collide_default(left_sprite, right_sprite):
     return result
 
 
+def segment_crosses_box(start, end, half_size):
+    """
+    Check if a segment passes through a square centered on the origin.
+
+    A slab test: clips the segment against each axis in turn.
+    """
+    enter, leave = 0.0, 1.0
+    for start_value, end_value in ((start.x, end.x), (start.y, end.y)):
+        change = end_value - start_value
+        if change == 0:
+            if abs(start_value) > half_size:
+                return False
+            continue
+        near = (-half_size - start_value) / change
+        far = (half_size - start_value) / change
+        if near > far:
+            near, far = far, near
+        enter = max(enter, near)
+        leave = min(leave, far)
+        if enter > leave:
+            return False
+    return True
+
+
+def does_sweep_collide(left_sprite, right_sprite, swept):
+    """
+    Check if two sprites touched at any point of their movement.
+
+    swept maps sprites to their (start, end) positions. Sprites missing from
+    it are treated as standing still.
+    """
+    left_position = left_sprite.position
+    right_position = right_sprite.position
+    left_start, left_end = swept.get(left_sprite, (left_position, left_position))
+    right_start, right_end = swept.get(right_sprite, (right_position, right_position))
+    return segment_crosses_box(
+        left_start - right_start,
+        left_end - right_end,
+        (left_sprite.size + right_sprite.size) / 2
+    )
+
+
+def does_collide_arc(arc_sprite, other_sprite):
+    """
+    Check if a sprite touches the swept part of an arc.
+
+    The arc covers start_angle to end_angle, in degrees from
+    arc_sprite.direction, at arc_sprite.radius around arc_sprite.pivot.
+    Tests a box of arc_sprite.size at the closest point of the arc the same
+    way does_collide_default would.
+    """
+    offset = other_sprite.position - arc_sprite.pivot
+    low, high = sorted((arc_sprite.start_angle, arc_sprite.end_angle))
+    angle = arc_sprite.direction.angle(offset) if offset else low
+    angle = min(max(angle, low), high)
+    point = arc_sprite.pivot + arc_sprite.direction.rotate(angle).scale_to(arc_sprite.radius)
+    half_size = arc_sprite.size / 2
+    width = (
+        max(point.x + half_size, other_sprite.left)
+        - min(point.x - half_size, other_sprite.left)
+    )
+    height = (
+        max(point.y + half_size, other_sprite.top)
+        - min(point.y - half_size, other_sprite.bottom)
+    )
+    combined_size = arc_sprite.size + other_sprite.size
+    return width <= combined_size and height <= combined_size
+
+
+shape_tests = {
+    "arc": does_collide_arc,
+}
+
+
+def does_collide_shaped(left_sprite, right_sprite):
+    """
+    Test a pair where at least one sprite declares a hit_shape.
+    """
+    left_shape = getattr(left_sprite, "hit_shape", None)
+    if left_shape is not None:
+        return shape_tests[left_shape](left_sprite, right_sprite)
+    return shape_tests[right_sprite.hit_shape](right_sprite, left_sprite)
+
+
 def generate_pairs(left_group, right_group):
     if left_group is right_group:
         yield from combinations(left_group, 2)
@@ -32,6 +131,71 @@ def generate_pairs(left_group, right_group):
         yield from product(left_group, right_group)
 
 
+def generate_special_pairs(left_group, right_group, special):
+    """
+    Yield each pair with at least one sprite in special exactly once.
+    """
+    seen = set()
+    pairs = chain(
+        ((left, right) for left in left_group if left in special for right in right_group),
+        ((left, right) for right in right_group if right in special for left in left_group),
+    )
+    for left, right in pairs:
+        key = frozenset((left, right))
+        if left is right or key in seen:
+            continue
+        seen.add(key)
+        yield left, right
+
+
+class SpatialHash:
+    """
+    A uniform grid broad phase.
+
+    Buckets the right group into square cells and only yields pairs from
+    neighboring cells. Pairs are yielded in the same order generate_pairs
+    would yield them, so a Collider produces identical results in either mode.
+
+    The default cell size is twice the largest sprite size in the groups,
+    which is the farthest apart does_collide_default can report a collision.
+    Pass cell_size if using a collides function with a longer reach.
+    """
+
+    def __init__(self, cell_size: Optional[float] = None):
+        self.cell_size = cell_size
+
+    def get_cell_size(self, left_group, right_group):
+        if self.cell_size is not None:
+            return self.cell_size
+        largest = max((s.size for s in (*left_group, *right_group)), default=0)
+        return max(largest * 2, 1)
+
+    def __call__(self, left_group, right_group):
+        cell_size = self.get_cell_size(left_group, right_group)
+        cells = defaultdict(list)
+        for index, sprite in enumerate(right_group):
+            position = sprite.position
+            cells[floor(position.x / cell_size), floor(position.y / cell_size)].append(index)
+
+        same_group = left_group is right_group
+        for left_index, left in enumerate(left_group):
+            position = left.position
+            x = floor(position.x / cell_size)
+            y = floor(position.y / cell_size)
+            candidates = []
+            for cell in (
+                (x - 1, y - 1), (x, y - 1), (x + 1, y - 1),
+                (x - 1, y), (x, y), (x + 1, y),
+                (x - 1, y + 1), (x, y + 1), (x + 1, y + 1),
+            ):
+                candidates.extend(cells.get(cell, ()))
+            if same_group:
+                candidates = [i for i in candidates if i > left_index]
+            candidates.sort()
+            for right_index in candidates:
+                yield left, right_group[right_index]
+
+
 def signal_collision(left_sprite, right_sprite):
     try:
         left_sprite.collided_with(right_sprite)
@@ -44,14 +208,37 @@ def signal_collision(left_sprite, right_sprite):
         pass
 
 
+def signal_contact(left_sprite, right_sprite, event_type, scene, signal):
+    """
+    Deliver a contact event directly to the two sprites involved.
+
+    Handlers follow the ppb naming convention, so CollisionStarted calls
+    on_collision_started(event, signal), where event.other is the other
+    sprite.
+    """
+    handler_name = contact_handler_names[event_type]
+    for sprite, other in ((left_sprite, right_sprite), (right_sprite, left_sprite)):
+        handler = getattr(sprite, handler_name, None)
+        if handler is not None:
+            handler(event_type(other, scene), signal)
+
+
+contact_handler_names = {
+    events.CollisionStarted: "on_collision_started",
+    events.CollisionOngoing: "on_collision_ongoing",
+    events.CollisionEnded: "on_collision_ended",
+}
+
+
 class Collider(System):
     running = False
     primed = False
-    groups_by_scene = {}
 
-    def __init__(self, *, collides=does_collide_default, **kwargs):
-        super().__init__(collides=collides, **kwargs)
+    def __init__(self, *, collides=does_collide_default, broad_phase=generate_pairs, **kwargs):
+        super().__init__(collides=collides, broad_phase=broad_phase, **kwargs)
         self.collides = collides
+        self.broad_phase = broad_phase
+        self.groups_by_scene = weakref.WeakKeyDictionary()
 
     def set_up_definitions(self, scene):
         if scene_pairs := getattr(scene, "collision_pairs", None):
@@ -64,21 +251,145 @@ class Collider(System):
         else:
             requires = {Sprite}
             pairs = {(Sprite, Sprite)}
-        self.groups_by_scene[scene] = SceneCollisionsDefinition(requires, pairs)
+        self.groups_by_scene[scene] = SceneCollisionsDefinition(
+            requires,
+            pairs,
+            track_contacts=getattr(scene, "track_contacts", False)
+        )
 
-    def calculate_collision(self, scene):
+    def calculate_collision(self, scene, signal=None):
         if scene not in self.groups_by_scene:
             self.set_up_definitions(scene)
         definitions: SceneCollisionsDefinition = self.groups_by_scene[scene]
         sprite_groups = {t: list(scene.get(kind=t)) for t in definitions.requires}
+        if definitions.track_contacts:
+            self.calculate_contacts(scene, definitions, sprite_groups, signal)
+            return
+        for left, right in self.detect_collisions(definitions, sprite_groups):
+            signal_collision(left, right)
+
+    def detect_collisions(self, definitions: SceneCollisionsDefinition, sprite_groups, moved=None):
+        """
+        Yield every colliding pair for the scene's collision pairs.
+
+        Sprites with a hit_shape are tested with their shape's test, and swept
+        sprites along their path. If moved is given, plain pairs where neither
+        sprite moved are skipped.
+        """
+        shaped = {
+            sprite for group in sprite_groups.values() for sprite in group
+            if getattr(sprite, "hit_shape", None) is not None
+        }
+        plain_groups = sprite_groups
+        if shaped:
+            plain_groups = {t: [s for s in group if s not in shaped] for t, group in sprite_groups.items()}
+        swept = self.update_swept_positions(definitions, plain_groups)
         for a, b in definitions.pairs:
-            for left, right in generate_pairs(sprite_groups[a], sprite_groups[b]):
-                if self.collides(left, right):
-                    signal_collision(left, right)
+            left_group, right_group = plain_groups[a], plain_groups[b]
+            if moved is None:
+                pairs = self.find_collisions(left_group, right_group)
+            else:
+                pairs = self.find_changed_collisions(left_group, right_group, moved)
+            found = set()
+            for left, right in pairs:
+                if swept:
+                    found.add(frozenset((left, right)))
+                yield left, right
+            if swept:
+                yield from self.find_swept_collisions(left_group, right_group, swept, found)
+            if shaped:
+                yield from self.find_shaped_collisions(sprite_groups[a], sprite_groups[b], shaped)
+
+    def calculate_contacts(self, scene, definitions: SceneCollisionsDefinition, sprite_groups, signal):
+        """
+        Update the persistent contact set of a scene.
+
+        Only pairs where at least one sprite moved or resized since the last
+        tick are tested. Sprites receive CollisionStarted when a contact
+        begins, CollisionOngoing when a retested contact still overlaps, and
+        CollisionEnded when it separates or either sprite leaves the scene.
+        Shaped sprites can change without moving, so they are always retested.
+        """
+        present = set()
+        for group in sprite_groups.values():
+            present.update(group)
+        last_seen = definitions.last_seen
+        moved = set()
+        for sprite in present:
+            state = sprite.position, sprite.size
+            if last_seen.get(sprite) != state or getattr(sprite, "hit_shape", None) is not None:
+                last_seen[sprite] = state
+                moved.add(sprite)
+        for sprite in last_seen.keys() - present:
+            del last_seen[sprite]
+
+        found = {}
+        for left, right in self.detect_collisions(definitions, sprite_groups, moved):
+            found[frozenset((left, right))] = left, right
+
+        contacts = definitions.contacts
+        ended = [
+            key for key, (left, right) in contacts.items()
+            if key not in found
+            and (left in moved or right in moved or left not in present or right not in present)
+        ]
+        for key in ended:
+            left, right = contacts.pop(key)
+            signal_contact(left, right, events.CollisionEnded, scene, signal)
+        for key, (left, right) in found.items():
+            if key in contacts:
+                signal_contact(left, right, events.CollisionOngoing, scene, signal)
+            else:
+                contacts[key] = left, right
+                signal_contact(left, right, events.CollisionStarted, scene, signal)
+
+    @staticmethod
+    def update_swept_positions(definitions: SceneCollisionsDefinition, sprite_groups):
+        """
+        Record where each swept sprite was at the last pass.
+
+        Sprites opt in with a truthy swept attribute. Returns a mapping of
+        swept sprites to their (start, end) positions for this pass.
+        """
+        previous = definitions.swept_positions
+        swept = {}
+        for group in sprite_groups.values():
+            for sprite in group:
+                if getattr(sprite, "swept", False) and sprite not in swept:
+                    position = sprite.position
+                    swept[sprite] = previous.get(sprite, position), position
+        definitions.swept_positions = {sprite: end for sprite, (_, end) in swept.items()}
+        return swept
+
+    def find_swept_collisions(self, left_group, right_group, swept, found):
+        """
+        Yield pairs with a swept sprite that passed through each other.
+
+        Pairs already in found are skipped, so this only reports collisions
+        the end positions missed.
+        """
+        for left, right in generate_special_pairs(left_group, right_group, swept):
+            if frozenset((left, right)) not in found and does_sweep_collide(left, right, swept):
+                yield left, right
 
-    def on_idle(self, idle: Idle, __):
+    def find_shaped_collisions(self, left_group, right_group, shaped):
+        for left, right in generate_special_pairs(left_group, right_group, shaped):
+            if does_collide_shaped(left, right):
+                yield left, right
+
+    def find_collisions(self, left_group, right_group):
+        for left, right in self.broad_phase(left_group, right_group):
+            if self.collides(left, right):
+                yield left, right
+
+    def find_changed_collisions(self, left_group, right_group, moved):
+        for left, right in self.broad_phase(left_group, right_group):
+            if (left in moved or right in moved) and self.collides(left, right):
+                yield left, right
+
+    def on_idle(self, idle: Idle, signal):
         if self.primed:
-            self.calculate_collision(idle.scene)
+            self.calculate_collision(idle.scene, signal)
             self.primed = False
 
     def on_update(self, _, __):
@@ -93,3 +404,73 @@ class Collider(System):
 
     def on_scene_continued(self, scene_event: SceneContinued, _):
         self.set_running(scene_event.scene)
+
+
+# Whether each sprite class keeps its position in a swarm, looked up once.
+swarm_kinds: Dict[type, bool] = {}
+
+
+def pack_bounds(group):
+    """
+    Pack the bounds of a sprite group into an array.
+
+    Rows are left, right, top, bottom, size. The sides are worked out from
+    one read of each sprite's position, where sprite.left and the rest each
+    read it again. Sprites whose class sets swarm_member (like SwarmEnemy)
+    are read straight from their swarm's positions array at their index.
+    """
+    coordinates = numpy.empty((3, len(group)))
+    swarms = {}
+    for column, sprite in enumerate(group):
+        kind = type(sprite)
+        member = swarm_kinds.get(kind)
+        if member is None:
+            member = swarm_kinds[kind] = getattr(kind, "swarm_member", False)
+        if member:
+            columns, rows = swarms.setdefault(sprite.swarm, ([], []))
+            columns.append(column)
+            rows.append(sprite.index)
+            coordinates[2, column] = sprite.size
+            continue
+        x, y = sprite.position
+        coordinates[:, column] = x, y, sprite.size
+    for swarm, (columns, rows) in swarms.items():
+        coordinates[:2, columns] = swarm.positions[rows].T
+    x, y, size = coordinates
+    half = size / 2
+    return numpy.stack((x - half, x + half, y + half, y - half, size))
+
+
+class VectorizedCollider(Collider):
+    """
+    A Collider that tests whole groups at once with numpy.
+
+    Uses the same test as does_collide_default and yields collisions in the
+    same order as the default Collider. The collides and broad_phase options
+    are ignored.
+    """
+    block_size = 2 ** 20  # Maximum pairs tested in a single operation.
+
+    def find_collisions(self, left_group, right_group):
+        if not left_group or not right_group:
+            return
+        same_group = left_group is right_group
+        left_bounds = pack_bounds(left_group)
+        right_bounds = left_bounds if same_group else pack_bounds(right_group)
+        right_left, right_right, right_top, right_bottom, right_size = right_bounds[:, None, :]
+        rows = max(1, self.block_size // len(right_group))
+        for start in range(0, len(left_group), rows):
+            left_left, left_right, left_top, left_bottom, left_size = left_bounds[:, start:start + rows, None]
+            width = numpy.maximum(left_right, right_left) - numpy.minimum(left_left, right_left)
+            height = numpy.maximum(left_top, right_top) - numpy.minimum(left_bottom, right_bottom)
+            combined_size = left_size + right_size
+            mask = (width <= combined_size) & (height <= combined_size)
+            if same_group:
+                mask = numpy.triu(mask, k=start + 1)
+            for left_index, right_index in zip(*numpy.nonzero(mask)):
+                yield left_group[start + left_index], right_group[right_index]
+
+    def find_changed_collisions(self, left_group, right_group, moved):
+        for left, right in self.find_collisions(left_group, right_group):
+            if left in moved or right in moved:
+                yield left, right
@@ -0,0 +1,31 @@
+from typing import Optional
+
+from ppb.events import Idle
+from ppb.events import PreRender
+from ppb.events import Quit
+from ppb.events import Update
+from ppb.systemslib import System
+
+
+class FixedStep(System):
+    """
+    Steps the simulation by a fixed time_step on every loop.
+
+    Replaces ppb's Updater and Renderer when running without a window: the
+    game runs as fast as the loop allows, and the same inputs always produce
+    the same frames. Quits after frames loops if given.
+    """
+
+    def __init__(self, *, time_step: float = 1 / 60, frames: Optional[int] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.time_step = time_step
+        self.frames = frames
+        self.frame = 0
+
+    def on_idle(self, _: Idle, signal):
+        if self.frames is not None and self.frame >= self.frames:
+            signal(Quit())
+            return
+        self.frame += 1
+        signal(Update(self.time_step))
+        signal(PreRender())
@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from typing import Dict
+from typing import List
+
+from ppb.events import Idle
+from ppb.systemslib import System
+
+
+@dataclass
+class PoolStats:
+    hits: int
+    misses: int
+    free: int
+    waiting: int
+
+
+class Pool:
+    """
+    A free list of instances of a single type.
+
+    Released instances wait until the next recycle before they are handed out
+    again, so systems that track sprites between frames (like Collider) see
+    them leave the scene before they come back as a new sprite.
+    """
+
+    def __init__(self, kind: type, capacity: int = 0):
+        self.kind = kind
+        self.free: List = [kind() for _ in range(capacity)]
+        self.waiting: List = []
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, **kwargs):
+        if not self.free:
+            self.misses += 1
+            return self.kind(**kwargs)
+        self.hits += 1
+        instance = self.free.pop()
+        instance.__dict__.clear()
+        instance.__init__(**kwargs)
+        return instance
+
+    def release(self, instance):
+        self.waiting.append(instance)
+
+    def recycle(self):
+        self.free.extend(self.waiting)
+        self.waiting.clear()
+
+    @property
+    def stats(self) -> PoolStats:
+        return PoolStats(self.hits, self.misses, len(self.free), len(self.waiting))
+
+
+pools: Dict[type, Pool] = {}
+
+
+def get_pool(kind: type) -> Pool:
+    try:
+        return pools[kind]
+    except KeyError:
+        pool = pools[kind] = Pool(kind, getattr(kind, "pool_capacity", 0))
+        return pool
+
+
+class Pooled:
+    """
+    Mixin for objects that should be reused instead of reallocated.
+
+    Create instances with acquire and hand them back with release once they
+    have been removed from the scene. Each subclass gets its own pool,
+    preallocated with pool_capacity instances on first use.
+    """
+    pool_capacity = 0
+
+    @classmethod
+    def acquire(cls, **kwargs):
+        return get_pool(cls).acquire(**kwargs)
+
+    def release(self):
+        get_pool(type(self)).release(self)
+
+
+class Recycler(System):
+    """
+    Makes released instances available again once per frame.
+
+    Pools start empty with each engine and are dropped when it stops, so
+    instances never outlive the engine that made them.
+
+    Place it after Collider in the systems list.
+    """
+
+    def __enter__(self):
+        pools.clear()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pools.clear()
+
+    def on_idle(self, _: Idle, __):
+        for pool in pools.values():
+            pool.recycle()
@@ -0,0 +1,231 @@
+import json
+import sys
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from functools import wraps
+from time import perf_counter
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from ppb.engine import GameEngine
+from ppb.events import Idle
+from ppb.systemslib import System
+from ppb.utils import camel_to_snake
+
+
+@dataclass
+class HandlerSample:
+    name: str
+    event: str
+    start: float
+    duration: float
+    blocks: int
+
+
+@dataclass
+class FrameProfile:
+    """
+    Everything dispatched between one Idle and the next.
+
+    blocks is the change in allocated memory blocks across the handler, so
+    it counts what a handler kept alive rather than every allocation.
+    """
+    index: int
+    start: float
+    duration: float = 0.0
+    samples: List[HandlerSample] = field(default_factory=list)
+
+    def totals(self) -> Dict[str, List]:
+        """
+        Total [seconds, calls, blocks] for each handler in the frame.
+        """
+        totals = {}
+        for sample in self.samples:
+            total = totals.setdefault(sample.name, [0.0, 0, 0])
+            total[0] += sample.duration
+            total[1] += 1
+            total[2] += sample.blocks
+        return totals
+
+
+class Profiler(System):
+    """
+    Times every event handler and keeps the last frames profiled.
+
+    While enabled, each handler's wall time and allocated blocks are
+    recorded, named by the class of the system, scene or sprite that handled
+    it. The engine still dispatches with its own publish: event extensions
+    are wrapped, and the engine's walk is replaced by one that times each
+    object between handing it to publish and being asked for the next. An
+    error in a handler propagates exactly as it would without the Profiler.
+    Disabled, the engine is left as it was.
+
+    Add it to the systems list, and save the frames with export_trace to load
+    in chrome://tracing or Perfetto. If trace_to is given, the trace is saved
+    there when the engine stops.
+    """
+
+    def __init__(
+            self, *,
+            engine: GameEngine,
+            profile_frames: int = 600,
+            profile: bool = True,
+            trace_to: Optional[str] = None,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.engine = engine
+        self.frames: Deque[FrameProfile] = deque(maxlen=profile_frames)
+        self.frame: Optional[FrameProfile] = None
+        self.enabled = False
+        self.start_enabled = profile
+        self.trace_to = trace_to
+        self.event_name: Optional[str] = None
+
+    def __enter__(self):
+        if self.start_enabled:
+            self.enable()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disable()
+        if self.trace_to is not None:
+            self.export_trace(self.trace_to)
+
+    def enable(self):
+        self.engine.publish = self.publish
+        self.engine.walk = self.walk
+        self.enabled = True
+
+    def disable(self):
+        self.engine.__dict__.pop("publish", None)
+        self.engine.__dict__.pop("walk", None)
+        for callbacks in self.engine.event_extensions.values():
+            callbacks[:] = [getattr(callback, "profiled", callback) for callback in callbacks]
+        self.enabled = False
+        self.frame = None
+
+    @property
+    def samples(self) -> List[HandlerSample]:
+        return self.frame.samples if self.frame is not None else []
+
+    def publish(self):
+        engine = self.engine
+        event = engine.events[0]
+        if isinstance(event, Idle):
+            self.start_frame()
+        for event_type in (type(event), ...):
+            callbacks = engine.event_extensions[event_type]
+            callbacks[:] = [self.timed(callback) for callback in callbacks]
+        self.event_name = type(event).__name__
+        try:
+            type(engine).publish(engine)
+        finally:
+            self.event_name = None
+
+    def timed(self, callback: Callable[[Any], None]) -> Callable[[Any], None]:
+        """
+        Wrap an event extension to record it.
+        """
+        if hasattr(callback, "profiled"):
+            return callback
+
+        @wraps(callback)
+        def timed_callback(event):
+            blocks = sys.getallocatedblocks()
+            start = perf_counter()
+            callback(event)
+            end = perf_counter()
+            self.samples.append(HandlerSample(
+                callback.__qualname__, type(event).__name__, start, end - start, sys.getallocatedblocks() - blocks
+            ))
+        timed_callback.profiled = callback
+        return timed_callback
+
+    def walk(self):
+        engine = self.engine
+        event_name = self.event_name
+        if event_name is None:
+            yield from type(engine).walk(engine)
+            return
+        handler_name = "on_" + camel_to_snake(event_name)
+        samples = self.samples
+        for obj in type(engine).walk(engine):
+            if not callable(getattr(obj, handler_name, None)):
+                yield obj
+                continue
+            blocks = sys.getallocatedblocks()
+            start = perf_counter()
+            yield obj
+            end = perf_counter()
+            samples.append(HandlerSample(
+                f"{type(obj).__name__}.{handler_name}",
+                event_name,
+                start,
+                end - start,
+                sys.getallocatedblocks() - blocks
+            ))
+
+    def start_frame(self):
+        now = perf_counter()
+        if self.frame is not None:
+            self.frame.duration = now - self.frame.start
+            self.frames.append(self.frame)
+        index = self.frame.index + 1 if self.frame is not None else 0
+        self.frame = FrameProfile(index, now)
+
+    def summary(self, count: int = 10) -> str:
+        """
+        The most expensive handlers over the recorded frames, one per line.
+        """
+        totals = {}
+        for frame in self.frames:
+            for name, (seconds, calls, blocks) in frame.totals().items():
+                total = totals.setdefault(name, [0.0, 0, 0])
+                total[0] += seconds
+                total[1] += calls
+                total[2] += blocks
+        frame_count = max(len(self.frames), 1)
+        lines = [f"{'handler':48} {'ms/frame':>9} {'calls/frame':>12} {'blocks/frame':>13}"]
+        for name, (seconds, calls, blocks) in sorted(totals.items(), key=lambda item: -item[1][0])[:count]:
+            lines.append(
+                f"{name:48} {seconds * 1000 / frame_count:9.3f} "
+                f"{calls / frame_count:12.1f} {blocks / frame_count:13.1f}"
+            )
+        return "\n".join(lines)
+
+    def trace(self) -> Dict:
+        """
+        The recorded frames in the Chrome trace event format.
+        """
+        events = []
+        for frame in self.frames:
+            events.append({
+                "name": f"frame {frame.index}",
+                "cat": "frame",
+                "ph": "X",
+                "ts": frame.start * 1e6,
+                "dur": frame.duration * 1e6,
+                "pid": 0,
+                "tid": 0,
+            })
+            for sample in frame.samples:
+                events.append({
+                    "name": sample.name,
+                    "cat": sample.event,
+                    "ph": "X",
+                    "ts": sample.start * 1e6,
+                    "dur": sample.duration * 1e6,
+                    "pid": 0,
+                    "tid": 0,
+                    "args": {"blocks": sample.blocks},
+                })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_trace(self, path):
+        with open(path, "w") as file:
+            json.dump(self.trace(), file)
@@ -0,0 +1,95 @@
+import struct
+from typing import BinaryIO
+from typing import Iterator
+from typing import NamedTuple
+
+MAGIC = b"SVCR"
+VERSION = 1
+HEADER = struct.Struct("<4sBd")
+DELTA = struct.Struct("<bb")
+
+SLASH_BIT = 0b001
+SHOOT_BIT = 0b010
+DASH_BIT = 0b100
+# The top five bits of each tick hold the change in walk: (dx + 2) * 5 + dy + 2
+# for steps of up to two in each axis, or ESCAPE followed by a DELTA.
+DELTA_LIMIT = 2
+ESCAPE = 31
+
+
+class ControlsState(NamedTuple):
+    horizontal: int
+    vertical: int
+    slash: bool
+    shoot: bool
+    dash: bool
+
+
+class ControlsWriter:
+    """
+    Streams one ControlsState per tick to a binary file.
+
+    Each tick takes a single byte: the three buttons as bits, and the change
+    in walk since the previous tick packed into the rest. Walk components
+    must be integers, as the Controller produces.
+    """
+
+    def __init__(self, file: BinaryIO, time_step: float = 0.0):
+        self.file = file
+        self.horizontal = 0
+        self.vertical = 0
+        file.write(HEADER.pack(MAGIC, VERSION, time_step))
+
+    def write(self, state: ControlsState):
+        dx = int(state.horizontal) - self.horizontal
+        dy = int(state.vertical) - self.vertical
+        self.horizontal += dx
+        self.vertical += dy
+        buttons = (state.slash and SLASH_BIT) | (state.shoot and SHOOT_BIT) | (state.dash and DASH_BIT)
+        if abs(dx) <= DELTA_LIMIT and abs(dy) <= DELTA_LIMIT:
+            code = (dx + DELTA_LIMIT) * 5 + dy + DELTA_LIMIT
+            self.file.write(bytes((code << 3 | buttons,)))
+        else:
+            self.file.write(bytes((ESCAPE << 3 | buttons,)) + DELTA.pack(dx, dy))
+
+    def close(self):
+        self.file.close()
+
+
+class ControlsReader:
+    """
+    Reads a recording made by ControlsWriter back one tick at a time.
+
+    time_step is the step the recording was made with.
+    """
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        magic, version, self.time_step = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} controls recording.")
+
+    def __iter__(self) -> Iterator[ControlsState]:
+        read = self.file.read
+        horizontal = vertical = 0
+        while tick := read(1):
+            packed = tick[0]
+            code = packed >> 3
+            if code == ESCAPE:
+                dx, dy = DELTA.unpack(read(DELTA.size))
+            else:
+                dx, dy = divmod(code, 5)
+                dx -= DELTA_LIMIT
+                dy -= DELTA_LIMIT
+            horizontal += dx
+            vertical += dy
+            yield ControlsState(
+                horizontal,
+                vertical,
+                bool(packed & SLASH_BIT),
+                bool(packed & SHOOT_BIT),
+                bool(packed & DASH_BIT)
+            )
+
+    def close(self):
+        self.file.close()
@@ -0,0 +1,59 @@
+import ctypes
+from typing import Iterable
+
+from ppb.events import SceneStarted
+from ppb.systems import Renderer
+from sdl2 import SDL_Rect
+
+from survival.atlas import AtlasRegion
+
+
+class AtlasRenderer(Renderer):
+    """
+    A Renderer that draws atlas regions and uploads textures up front.
+
+    Sprites whose image is an AtlasRegion draw just their rect from the
+    shared atlas texture. The images in preload are waited on (ppb decodes
+    them on its loader threads) and turned into textures when the first
+    scene starts, instead of the first time a sprite using them is drawn.
+
+    Use it in place of ppb's Renderer in basic_systems.
+    """
+
+    def __init__(self, *, preload: Iterable = (), **kwargs):
+        super().__init__(**kwargs)
+        self.preload = list(preload)
+
+    def on_scene_started(self, event: SceneStarted, signal):
+        for image in self.preload:
+            self.prepare_resource(PreloadTarget(image))
+        self.preload.clear()
+
+    def compute_rectangles(self, texture, game_object, camera):
+        region = game_object.__image__()
+        if not isinstance(region, AtlasRegion):
+            return super().compute_rectangles(texture, game_object, camera)
+        x, y, width, height = region.rect
+        src_rect = SDL_Rect(x=x, y=y, w=width, h=height)
+        win_w, win_h = self.target_resolution(width, height, game_object.size)
+        center = camera.translate_to_viewport(game_object.position)
+        dest_rect = SDL_Rect(
+            x=int(center.x - win_w / 2),
+            y=int(center.y - win_h / 2),
+            w=win_w,
+            h=win_h,
+        )
+        return src_rect, dest_rect, ctypes.c_double(-game_object.rotation)
+
+
+class PreloadTarget:
+    """
+    Stands in for a sprite so Renderer.prepare_resource builds a texture.
+    """
+    size = 1
+
+    def __init__(self, image):
+        self.image = image
+
+    def __image__(self):
+        return self.image
@@ -0,0 +1,228 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+import numpy
+from ppb import Vector
+from ppb.events import Update
+from ppb.systemslib import System
+
+from survival.systems.clock import clock
+from survival.utils import quadratic_ease_in
+from survival.utils import quadratic_ease_out
+
+# Each curve maps the fraction of the duration that has run to the fraction
+# of the change applied, for an array of tweens at once.
+CURVES: Dict[str, Callable[[numpy.ndarray], numpy.ndarray]] = {
+    "linear": lambda run: run,
+    "ease_in": lambda run: quadratic_ease_in(run, 0, 1, 1),
+    "ease_out": lambda run: quadratic_ease_out(run, 0, 1, 1),
+}
+CURVE_CODES = {name: code for code, name in enumerate(CURVES)}
+
+Tweenable = Union[float, Vector]
+
+
+class Tweens:
+    """
+    Every running tween, stored as arrays so they can be stepped at once.
+
+    A tween moves an attribute of target from start to start + change over
+    duration seconds of the simulation clock, along one of the CURVES. Both
+    floats and Vectors can be tweened. step writes the current value of
+    every tween, then drops the finished ones and calls their on_done.
+
+    New tweens wait in a list until the next step copies them into the
+    arrays all at once, so a tween cancelled before then costs no array
+    writes.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.count = 0
+        self.next_handle = 0
+        self.handles: List[int] = []
+        self.rows: Dict[int, int] = {}
+        self.targets: List[Any] = []
+        self.attributes: List[str] = []
+        self.on_done: List[Optional[Callable[[], Any]]] = []
+        self.pending: List[tuple] = []
+        self.starts = numpy.zeros((capacity, 2))
+        self.changes = numpy.zeros((capacity, 2))
+        self.began = numpy.zeros(capacity)
+        self.durations = numpy.ones(capacity)
+        self.curves = numpy.zeros(capacity, dtype=numpy.int8)
+        self.vectors = numpy.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return self.count + len(self.pending)
+
+    def add(
+            self,
+            target: Any,
+            attribute: str,
+            start: Tweenable,
+            change: Tweenable,
+            duration: float,
+            curve: str = "linear",
+            on_done: Callable[[], Any] = None,
+            began: float = None
+    ) -> int:
+        """
+        Start a tween, by default from the current time.
+
+        :return: A handle for checking if the tween is still active.
+        """
+        if duration <= 0:
+            raise ValueError("Tweens need a positive duration.")
+        vector = isinstance(start, Vector)
+        handle = self.next_handle
+        self.next_handle += 1
+        self.rows[handle] = -1  # Not in the arrays until the next flush.
+        self.pending.append((
+            handle,
+            target,
+            attribute,
+            on_done,
+            (start.x, start.y) if vector else (start, 0),
+            (change.x, change.y) if vector else (change, 0),
+            clock() if began is None else began,
+            duration,
+            CURVE_CODES[curve],
+            vector,
+        ))
+        return handle
+
+    def active(self, handle: int) -> bool:
+        return handle in self.rows
+
+    def stop(self, handle: int):
+        """
+        Drop a tween without calling its on_done. Does nothing if it ended.
+        """
+        index = self.rows.get(handle)
+        if index is None:
+            return
+        if index >= 0:
+            self.remove(index)
+            return
+        del self.rows[handle]
+        self.pending = [tween for tween in self.pending if tween[0] != handle]
+
+    def cancel(self, target: Any):
+        """
+        Drop every tween of target without calling on_done.
+        """
+        if self.pending:
+            kept = []
+            for tween in self.pending:
+                if tween[1] is target:
+                    del self.rows[tween[0]]
+                else:
+                    kept.append(tween)
+            self.pending = kept
+        for index in range(self.count - 1, -1, -1):
+            if self.targets[index] is target:
+                self.remove(index)
+
+    def clear(self):
+        for tween in self.pending:
+            del self.rows[tween[0]]
+        self.pending.clear()
+        while self.count:
+            self.remove(self.count - 1)
+
+    def flush(self):
+        """
+        Copy the pending tweens into the arrays.
+        """
+        if not self.pending:
+            return
+        first, last = self.count, self.count + len(self.pending)
+        while last > len(self.began):
+            self.grow()
+        handles, targets, attributes, on_done, *columns = zip(*self.pending)
+        for name, column in zip(("starts", "changes", "began", "durations", "curves", "vectors"), columns):
+            getattr(self, name)[first:last] = column
+        for index, handle in enumerate(handles, first):
+            self.rows[handle] = index
+        self.handles.extend(handles)
+        self.targets.extend(targets)
+        self.attributes.extend(attributes)
+        self.on_done.extend(on_done)
+        self.count = last
+        self.pending.clear()
+
+    def grow(self):
+        capacity = max(1, len(self.began) * 2)
+        for name in ("starts", "changes", "began", "durations", "curves", "vectors"):
+            old = getattr(self, name)
+            new = numpy.ones((capacity, *old.shape[1:]), dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def remove(self, index: int):
+        """
+        Remove a tween, moving the last one into its slot.
+        """
+        last = self.count - 1
+        for name in ("starts", "changes", "began", "durations", "curves", "vectors"):
+            array = getattr(self, name)
+            array[index] = array[last]
+        del self.rows[self.handles[index]]
+        for values in (self.handles, self.targets, self.attributes, self.on_done):
+            values[index] = values[last]
+            values.pop()
+        if index != last:
+            self.rows[self.handles[index]] = index
+        self.count -= 1
+
+    def step(self, now: float):
+        self.flush()
+        count = self.count
+        if not count:
+            return
+        run = numpy.clip((now - self.began[:count]) / self.durations[:count], 0, 1)
+        eased = numpy.empty_like(run)
+        curves = self.curves[:count]
+        for code, curve in enumerate(CURVES.values()):
+            uses = curves == code
+            if uses.any():
+                eased[uses] = curve(run[uses])
+        values = (self.starts[:count] + self.changes[:count] * eased[:, None]).tolist()
+        for target, attribute, vector, (x, y) in zip(self.targets, self.attributes, self.vectors[:count].tolist(), values):
+            setattr(target, attribute, Vector(x, y) if vector else x)
+
+        finished = []
+        for index in numpy.flatnonzero(run >= 1)[::-1].tolist():
+            finished.append(self.on_done[index])
+            self.remove(index)
+        for on_done in finished:
+            if on_done is not None:
+                on_done()
+
+
+tweens = Tweens()
+
+
+class TweenSystem(System):
+    """
+    Steps every tween once per Update.
+
+    Must come after ClockSystem, and before the systems whose behaviors wait
+    on tweens, so they see a tween finish on the frame it does.
+
+    Tweens start empty with each engine and are dropped when it stops, so
+    they never keep its sprites alive.
+    """
+
+    def __enter__(self):
+        tweens.clear()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        tweens.clear()
+
+    def on_update(self, event: Update, _):
+        tweens.step(event.now)
@@ -0,0 +1,105 @@
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from math import hypot
+from time import perf_counter
+from typing import Deque
+from typing import List
+from typing import Optional
+
+import numpy
+from ppb import Vector
+from ppb.events import Update
+from ppb.systemslib import System
+
+
+@dataclass
+class Wave:
+    """
+    count enemies to spawn, starting at seconds into the scene.
+    """
+    count: int
+    at: float
+
+
+def escalating_waves(first: int = 5, growth: float = 1.5, interval: float = 20, waves: int = 10) -> List[Wave]:
+    """
+    Waves every interval seconds, each growth times bigger than the last.
+    """
+    return [Wave(round(first * growth ** index), index * interval) for index in range(waves)]
+
+
+@dataclass
+class WaveState:
+    elapsed: float = 0.0
+    next_wave: int = 0
+    pending: Deque[List[float]] = field(default_factory=deque)
+
+
+class WaveSpawner(System):
+    """
+    Spawns the waves of a scene a few enemies at a time.
+
+    Scenes opt in with a waves list and a spawn_enemy(position) method. When
+    a wave is due, the offsets of all its enemies are drawn at once; each
+    Update then spawns them until spawn_limit enemies or spawn_budget seconds
+    are used, so a big wave is spread across frames instead of stalling one.
+
+    Enemies appear in a ring just outside the main camera's view, placed
+    around wherever the camera is when they spawn. Without a spawn_budget
+    only the count limit applies, and runs are repeatable.
+    """
+
+    def __init__(
+            self, *,
+            spawn_limit: int = 32,
+            spawn_budget: Optional[float] = 0.002,
+            spawn_depth: float = 3,
+            seed: int = 0,
+            timer=perf_counter,
+            **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.spawn_limit = spawn_limit
+        self.spawn_budget = spawn_budget
+        self.spawn_depth = spawn_depth
+        self.random = numpy.random.default_rng(seed)
+        self.timer = timer
+        self.states = weakref.WeakKeyDictionary()
+
+    def on_update(self, event: Update, signal):
+        scene = event.scene
+        waves = getattr(scene, "waves", None)
+        if not waves:
+            return
+        try:
+            state = self.states[scene]
+        except KeyError:
+            state = self.states[scene] = WaveState()
+
+        state.elapsed += event.time_delta
+        while state.next_wave < len(waves) and waves[state.next_wave].at <= state.elapsed:
+            state.pending.extend(self.offsets(waves[state.next_wave].count).tolist())
+            state.next_wave += 1
+        if state.pending:
+            self.spawn(scene, state.pending)
+
+    def offsets(self, count: int) -> numpy.ndarray:
+        """
+        Draw a direction and a depth past the edge of the view for each enemy.
+        """
+        angles = self.random.uniform(0, 2 * numpy.pi, count)
+        depths = self.random.uniform(1, 1 + self.spawn_depth, count)
+        return numpy.stack([numpy.cos(angles), numpy.sin(angles), depths], axis=1)
+
+    def spawn(self, scene, pending: Deque[List[float]]):
+        camera = scene.main_camera
+        center = camera.position
+        view_radius = hypot(camera.half_width, camera.half_height)
+        deadline = None if self.spawn_budget is None else self.timer() + self.spawn_budget
+        for _ in range(min(self.spawn_limit, len(pending))):
+            direction_x, direction_y, depth = pending.popleft()
+            scene.spawn_enemy(center + Vector(direction_x, direction_y) * (view_radius + depth))
+            if deadline is not None and self.timer() >= deadline:
+                break
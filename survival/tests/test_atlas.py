@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from ppb import Sprite
+from ppb import Vector
+from ppb.camera import Camera
+
+from survival import assets
+from survival.atlas import ART_DIRECTORY
+from survival.atlas import AtlasRegion
+from survival.atlas import PADDING
+from survival.atlas import build_atlas
+from survival.atlas import pack
+from survival.systems import AtlasRenderer
+
+
+def test_pack_keeps_rects_apart():
+    sizes = {"a": (30, 30), "b": (20, 10), "c": (30, 20), "d": (40, 30)}
+    rects, height = pack(sizes, width=64)
+
+    for name, (x, y, w, h) in rects.items():
+        assert (w, h) == sizes[name]
+        assert x + w <= 64 and y + h <= height
+        for other, (ox, oy, ow, oh) in rects.items():
+            if other != name:
+                assert x + w + PADDING <= ox or ox + ow + PADDING <= x or y + h + PADDING <= oy or oy + oh + PADDING <= y
+
+
+def test_build_atlas(tmp_path):
+    image_path = tmp_path / "atlas.png"
+    manifest_path = tmp_path / "atlas.json"
+
+    rects = build_atlas(
+        [ART_DIRECTORY / "zombie.png", ART_DIRECTORY / "player.png"],
+        image_path=image_path,
+        manifest_path=manifest_path,
+        image_name="atlas.png"
+    )
+
+    assert image_path.read_bytes().startswith(b"\x89PNG")
+    assert manifest_path.read_text().endswith("}\n")
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["image"] == "atlas.png"
+    assert {name: tuple(rect) for name, rect in manifest["regions"].items()} == rects
+    assert rects["zombie"][2:] == (32, 32)
+    assert "arrow" in rects
+
+
+def test_build_atlas_reports_sdl_errors(tmp_path):
+    with pytest.raises(RuntimeError, match="IMG_Load"):
+        build_atlas(
+            [tmp_path / "missing.png"],
+            image_path=tmp_path / "atlas.png",
+            manifest_path=tmp_path / "atlas.json"
+        )
+
+
+def test_sprites_share_one_atlas():
+    assert isinstance(assets.zombie, AtlasRegion)
+    assert assets.zombie.atlas is assets.arrow.atlas is assets.preload[0]
+
+
+def test_renderer_draws_region():
+    renderer = AtlasRenderer()
+    renderer.pixel_ratio = 64
+    sprite = Sprite(image=assets.zombie, position=Vector(0, 0))
+
+    src, dest, _ = renderer.compute_rectangles(None, sprite, Camera())
+
+    assert (src.x, src.y, src.w, src.h) == assets.zombie.rect
+    assert (dest.w, dest.h) == (64, 64)
@@ -0,0 +1,59 @@
+import numpy
+import pytest
+
+from survival.batch import main
+from survival.batch import random_script
+from survival.batch import run_batch
+from survival.batch import run_session
+
+
+def game_metrics(config):
+    metrics = run_session(config)
+    return {k: v for k, v in metrics.items() if not k.endswith("_frame_ms")}
+
+
+def test_random_script_is_seeded():
+    assert random_script(3, 300).keys() == random_script(3, 300).keys()
+    assert random_script(3, 300).keys() != random_script(4, 300).keys()
+
+
+def test_run_session_is_reproducible():
+    config = {"seed": 1, "frames": 300}
+    assert game_metrics(config) == game_metrics(config)
+
+
+def test_charge_levels_change_the_session():
+    config = {"seed": 1, "frames": 900}
+    quick_slash = {**config, "slash_levels": (.05, .1, .15, .2)}
+    default, quick = game_metrics(config), game_metrics(quick_slash)
+
+    assert quick["slash_levels"] == (.05, .1, .15, .2)
+    assert (default["kills"], default["enemies_left"]) != (quick["kills"], quick["enemies_left"])
+
+
+def test_unknown_settings_are_rejected():
+    with pytest.raises(ValueError, match="slash_cooldown"):
+        run_session({"seed": 1, "slash_cooldown": .1})
+
+
+def test_run_batch_writes_columns(tmp_path):
+    out_path = tmp_path / "results.npz"
+    configs = [{"seed": seed, "frames": 60, "slash_cool_down": .25} for seed in range(3)]
+    columns = run_batch(configs, out_path, workers=2)
+
+    saved = numpy.load(out_path)
+    assert list(saved["seed"]) == [0, 1, 2]
+    assert list(saved["slash_cool_down"]) == [.25] * 3
+    assert list(saved["kills"]) == list(columns["kills"])
+
+
+def test_main_sweeps_charge_levels(tmp_path):
+    out_path = tmp_path / "sweep.npz"
+    main([
+        "--seeds", "1", "--frames", "30", "--workers", "2", "--out", str(out_path),
+        "--dash-levels", ".2", ".4", ".6", ".8", "--dash-levels", ".4", ".8", "1.2", "1.6",
+    ])
+
+    saved = numpy.load(out_path)
+    assert saved["dash_levels"].tolist() == [[.2, .4, .6, .8], [.4, .8, 1.2, 1.6]]
+    assert saved["slash_levels"].tolist() == [[.4, .8, 1.2, 1.6]] * 2
@@ -0,0 +1,54 @@
+from survival.benchmarks import Benchmark
+from survival.benchmarks import benchmarks
+from survival.benchmarks import compare
+from survival.benchmarks import load_results
+from survival.benchmarks import measure
+from survival.benchmarks import remeasure
+from survival.benchmarks import save_results
+
+
+def test_compare_finds_regressions():
+    baseline = {"fast": {"seconds": 1.0}, "slow": {"seconds": 1.0}}
+    results = {"fast": {"seconds": 1.1}, "slow": {"seconds": 1.5}, "new": {"seconds": 9.0}}
+
+    regressions = compare(results, baseline, threshold=.25)
+
+    assert [r.name for r in regressions] == ["slow"]
+    assert regressions[0].ratio == 1.5
+
+
+def test_measure_reports_per_unit():
+    result = measure(Benchmark("sum", lambda: lambda: sum(range(100)), units=100, repeat=1))
+    assert result["seconds"] * 100 < 1
+    assert result["per_second"] == 1 / result["seconds"]
+
+
+def test_saved_results_round_trip(tmp_path):
+    path = tmp_path / "results.json"
+    results = {"fast": {"seconds": 1.0, "per_second": 1.0, "units": 1, "calls": 5}}
+
+    save_results(path, results)
+
+    assert load_results(path) == results
+    assert path.read_text().endswith("}\n")
+
+
+def test_benchmarks_cover_hot_paths():
+    assert "collider.same_type[5000]" in benchmarks
+    assert "collider.cross_type[5000]" in benchmarks
+    assert "collider.same_type.vectorized[5000]" in benchmarks
+    assert "collider.cross_type.vectorized[5000]" in benchmarks
+    for name in ["behavior.player_tick", "swarm.update", "slash.spawn_arc", "headless.sandbox_frame"]:
+        benchmarks[name].setup()()
+
+
+def test_remeasure_keeps_the_faster_result():
+    benchmarks["test.sum"] = Benchmark("test.sum", lambda: lambda: sum(range(100)), repeat=1)
+    try:
+        results = {"test.sum": {"seconds": 1.0}, "other": {"seconds": 1.0}}
+        remeasure(results, ["test.sum"])
+    finally:
+        del benchmarks["test.sum"]
+
+    assert results["test.sum"]["seconds"] < 1.0
+    assert results["other"] == {"seconds": 1.0}
@@ -0,0 +1,45 @@
+from ppb import Sprite
+
+from survival.collection import IndexedScene
+from survival.hitbox import Arrow
+from survival.hitbox import PlayerHurtBox
+
+
+class Player(Sprite):
+    pass
+
+
+def test_kinds_include_subclasses():
+    scene = IndexedScene()
+    arrow = Arrow()
+    box = PlayerHurtBox()
+    scene.add(box)
+    scene.add(arrow, tags=["shot"])
+
+    assert list(scene.get(kind=PlayerHurtBox)) == [box, arrow]
+    assert list(scene.get(kind=Arrow)) == [arrow]
+    assert list(scene.get(kind=PlayerHurtBox, tag="shot")) == [arrow]
+
+    scene.remove(arrow)
+    assert list(scene.get(kind=PlayerHurtBox)) == [box]
+    assert list(scene.get(tag="shot")) == []
+
+
+def test_lookups_are_snapshots():
+    scene = IndexedScene()
+    first = Player()
+    scene.add(first)
+    found = scene.get(kind=Player)
+    scene.add(Player())
+
+    assert list(found) == [first]
+    assert len(list(scene.get(kind=Player))) == 2
+
+
+def test_first():
+    scene = IndexedScene()
+    assert scene.first(kind=Player) is None
+    player = Player()
+    scene.add(player)
+    assert scene.first(kind=Player) is player
+    assert scene.first(tag="main_camera") is scene.main_camera
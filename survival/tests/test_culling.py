@@ -0,0 +1,121 @@
+from ppb import Image
+from ppb import Sprite
+from ppb import Vector
+
+from survival import assets
+from survival.culling import CulledScene
+from survival.culling import StaticGrid
+from survival.culling import draw_order
+from survival.enemies import EnemySwarm
+
+
+class Decal(Sprite):
+    layer = -5
+
+
+class Walker(Sprite):
+    pass
+
+
+class Marker(Sprite):
+    layer = 20
+
+
+class DecalScene(CulledScene):
+    static_kinds = (Decal,)
+
+
+def test_static_grid_query():
+    grid = StaticGrid(cell_size=2)
+    near = Decal(position=Vector(1, 1))
+    far = Decal(position=Vector(50, 50))
+    grid.add(near)
+    grid.add(far)
+
+    assert list(grid.query(-1, 3, -1, 3)) == [near]
+
+    grid.remove(near)
+    assert list(grid.query(-1, 3, -1, 3)) == []
+    assert len(grid) == 1
+
+
+def test_only_visible_sprites_are_rendered():
+    scene = DecalScene()
+    scene.main_camera.position = Vector(100, 0)
+    visible = [
+        Marker(position=Vector(100, 0)),
+        Walker(position=Vector(101, 1)),
+        Decal(position=Vector(99, -1)),
+        Walker(position=Vector(100 + scene.main_camera.half_width + .5, 0)),  # Overlaps the edge.
+    ]
+    hidden = [
+        Walker(position=Vector(0, 0)),
+        Decal(position=Vector(0, 0)),
+        Decal(position=Vector(100, 40)),
+    ]
+    for sprite in visible + hidden:
+        scene.add(sprite)
+
+    layers = list(scene.sprite_layers())
+
+    assert set(layers) == set(visible)
+    assert [sprite.layer for sprite in layers] == sorted(sprite.layer for sprite in layers)
+    assert layers[0] is visible[2]
+    assert layers[-1] is visible[0]
+
+
+def test_removed_sprites_are_not_rendered():
+    scene = DecalScene()
+    decal = Decal()
+    walker = Walker()
+    scene.add(decal)
+    scene.add(walker)
+    scene.remove(decal)
+    scene.remove(walker)
+
+    assert list(scene.sprite_layers()) == []
+
+
+def test_draw_order_groups_images_by_name():
+    sprites = [
+        Walker(image=Image("zebra.png")),
+        Walker(image=Image("ant.png")),
+        Walker(image=Image("zebra.png")),
+        Marker(image=Image("ant.png")),
+        Walker(image=None),
+    ]
+
+    ordered = sorted(sprites, key=draw_order)
+
+    assert ordered == [sprites[4], sprites[1], sprites[0], sprites[2], sprites[3]]
+
+
+def test_draw_order_groups_atlas_regions():
+    sprites = [
+        Walker(image=assets.zombie),
+        Walker(image=assets.player),
+        Walker(image=assets.zombie),
+        Walker(image=assets.dead_zombie),
+    ]
+
+    ordered = sorted(sprites, key=draw_order)
+
+    assert ordered == [sprites[1], sprites[0], sprites[2], sprites[3]]
+    assert draw_order(sprites[0]) == (0, "zombie")
+
+
+def test_swarms_are_culled_together():
+    scene = CulledScene()
+    swarm = EnemySwarm()
+    visible = [swarm.spawn(position=Vector(x, 0)) for x in range(3)]
+    hidden = swarm.spawn(position=Vector(100, 0))
+    removed = swarm.spawn(position=Vector(0, 1))
+    outside = swarm.spawn(position=Vector(0, 2))  # In the swarm, never in the scene.
+    for sprite in (*visible, hidden, removed):
+        scene.add(sprite)
+    scene.remove(removed)
+
+    layers = list(scene.sprite_layers())
+
+    assert layers == visible
+    assert outside not in layers
@@ -0,0 +1,99 @@
+from ppb import BaseScene
+from ppb import Vector
+from ppb.events import Update
+
+from survival.events import CollisionOngoing
+from survival.events import CollisionStarted
+from survival.hitbox import PlayerHurtBox
+from survival.hitbox import SlashArc
+
+from survival.enemies import Body
+from survival.enemies import Corpses
+from survival.enemies import Enemy
+from survival.enemies import EnemySwarm
+from survival.enemies import leave_body
+
+
+def make_pairs(count):
+    scene = BaseScene()
+    swarm = EnemySwarm(capacity=2)
+    pairs = []
+    for x in range(count):
+        plain = Enemy(position=Vector(x, 0))
+        handle = swarm.spawn(position=Vector(x, 0))
+        if x % 2:
+            plain.push_velocity = handle.push_velocity = Vector(x, 1)
+            plain.stunned = handle.stunned = True
+        scene.add(plain)
+        scene.add(handle)
+        pairs.append((plain, handle))
+    return scene, swarm, pairs
+
+
+def test_swarm_matches_enemy_updates():
+    scene, swarm, pairs = make_pairs(9)
+
+    for _ in range(200):
+        swarm.update(scene, 0.016)
+        for plain, _ in pairs:
+            plain.on_update(Update(0.016, scene), None)
+
+    for plain, handle in pairs:
+        assert handle.position.isclose(plain.position)
+        assert handle.stunned == plain.stunned
+        assert (handle.push_velocity is None) == (plain.push_velocity is None)
+
+
+def test_swarm_removes_dead():
+    scene, swarm, pairs = make_pairs(5)
+    dead = pairs[1][1]
+    last = pairs[4][1]
+    dead.dead = True
+
+    swarm.update(scene, 0.016)
+
+    assert len(swarm) == 4
+    assert dead not in scene
+    assert dead.position == Vector(1, 0)
+    assert last.index == 1
+    assert last.position == Vector(4, 0)
+    assert [b.position for b in scene.get(kind=Body)] == [Vector(1, 0)]
+
+
+def test_corpses_evict_oldest():
+    scene = BaseScene()
+    corpses = Corpses(capacity=3)
+    scene.corpses = corpses
+    for x in range(5):
+        leave_body(scene, Vector(x, 0))
+
+    assert len(corpses) == 3
+    assert sorted(b.position.x for b in scene.get(kind=Body)) == [2, 3, 4]
+
+
+def test_lingering_hurt_box_pushes_again():
+    scene = BaseScene()
+    enemy = Enemy(position=Vector(1, 0))
+    hurt_box = PlayerHurtBox(position=Vector(0, 0))
+    enemy.on_collision_started(CollisionStarted(hurt_box), None)
+    first_push = enemy.push_velocity
+
+    enemy.on_collision_ongoing(CollisionOngoing(hurt_box), None)
+    assert enemy.push_velocity == first_push
+
+    while enemy.push_velocity is not None:
+        enemy.on_update(Update(0.1, scene), None)
+    enemy.on_collision_ongoing(CollisionOngoing(hurt_box), None)
+
+    assert enemy.push_velocity is not None
+    assert enemy.stunned
+
+
+def test_slash_arc_pushes_away_from_pivot():
+    arc = SlashArc(pivot=Vector(0, 0), direction=Vector(0, 1))
+    enemy = Enemy(position=Vector(0, 1.5))
+    assert arc.position != arc.pivot
+
+    enemy.on_collision_started(CollisionStarted(arc), None)
+
+    assert enemy.push_velocity.normalize().isclose(Vector(0, 1))
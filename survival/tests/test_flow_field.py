@@ -0,0 +1,39 @@
+import numpy
+from ppb import Vector
+
+from survival.flow_field import FlowField
+
+
+def test_rebuilds_only_on_cell_change():
+    field = FlowField(radius=4)
+    assert field.update(Vector(0.5, 0.5))
+    assert not field.update(Vector(0.9, 0.1))
+    assert field.update(Vector(1.5, 0.5))
+
+
+def test_directions_point_at_target():
+    field = FlowField(radius=4)
+    field.update(Vector(0.5, 0.5))
+    directions = field.directions_at(numpy.array([[3.5, 0.5], [0.5, -2.5], [20, 0.5], [0.5, 0.5]]))
+
+    numpy.testing.assert_allclose(directions, [[-1, 0], [0, 1], [-1, 0], [0, 0]])
+
+
+def test_open_field_matches_search():
+    open_field = FlowField(radius=5)
+    open_field.update(Vector(0, 0))
+    searched = FlowField(radius=5, blocked=[(100, 100)])
+    searched.update(Vector(0, 0))
+
+    numpy.testing.assert_allclose(open_field.distances, searched.distances)
+
+
+def test_routes_around_walls():
+    wall = [(1, y) for y in range(-2, 3)]
+    field = FlowField(radius=4, blocked=wall)
+    field.update(Vector(0.5, 0.5))
+
+    assert field.distances[4, 6] > 2
+    direction = field.directions_at(numpy.array([[2.5, 0.5]]))[0]
+    assert direction[0] >= 0
+    assert direction[1] != 0
@@ -0,0 +1,247 @@
+import gc
+import weakref
+from math import inf
+from random import Random
+from types import SimpleNamespace
+
+from misbehave import action
+from misbehave import decorator
+from misbehave import selector
+from misbehave.common import State
+from ppb import BaseScene
+from ppb.events import Update
+
+import ppb_misbehave as bt_ppb
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class Scripted:
+    """A leaf that returns whatever the actor's script says."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __call__(self, actor, context):
+        return context.event.script[self.name]
+
+
+def build_tree(clock):
+    return selector.Priority(
+        decorator.Debounce(
+            selector.Sequence(
+                decorator.Inverter(Scripted("a")),
+                bt_ppb.ThrowEventOnSuccess(
+                    action.SetCurrentTime("started", timer=clock),
+                    event_type=tuple,
+                    get_event_params=lambda actor: [[actor.count]]
+                ),
+                action.Wait("started", 3, timer=clock),
+                action.IncreaseValue("count"),
+                action.SetValue("flag", True),
+            ),
+            delay=2,
+            timer=clock
+        ),
+        selector.Concurrent(
+            Scripted("b"),
+            selector.Sequence(action.CheckValue("flag"), Scripted("c"), action.Idle()),
+            num_fail=2
+        ),
+        selector.Sequence(Scripted("c"), action.SetValue("flag", False)),
+    )
+
+
+def test_compiled_tree_matches_original():
+    clock = FakeClock()
+    tree = build_tree(clock)
+    compiled = bt_ppb.compile_tree(tree)
+    original_actor = SimpleNamespace(count=0)
+    compiled_actor = SimpleNamespace(count=0)
+    original_signals = []
+    compiled_signals = []
+    rng = Random(4)
+    states = [State.SUCCESS, State.FAILED, State.RUNNING]
+
+    for _ in range(500):
+        clock.now += rng.random()
+        script = {name: rng.choice(states) for name in "abc"}
+        event = SimpleNamespace(script=script)
+        original = tree(original_actor, bt_ppb.Context(None, event, original_signals.append))
+        result = compiled(compiled_actor, bt_ppb.Context(None, event, compiled_signals.append))
+
+        assert result is original
+        assert vars(compiled_actor) == vars(original_actor)
+    assert compiled_signals == original_signals
+    assert original_signals
+
+
+def test_unknown_nodes_are_kept():
+    node = Scripted("a")
+    assert bt_ppb.compile_tree(node) is node
+
+
+class Recorder(bt_ppb.BehaviorMixin):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.contexts = []
+        self.behavior_tree = self.record
+
+    def record(self, actor, context):
+        self.contexts.append((context, context.event))
+        return State.SUCCESS
+
+
+def test_behavior_system_ticks_actors():
+    scene = BaseScene()
+    actors = [Recorder(), Recorder()]
+    for actor in actors:
+        scene.add(actor)
+    system = bt_ppb.BehaviorSystem()
+
+    first, second = Update(0.016, scene), Update(0.016, scene)
+    system.on_update(first, None)
+    system.on_update(second, None)
+
+    for actor in actors:
+        (first_context, first_event), (second_context, second_event) = actor.contexts
+        assert first_context is second_context
+        assert first_event is first
+        assert second_event is second
+
+
+class SelfTickingRecorder(bt_ppb.SelfTickingBehaviorMixin, Recorder):
+    pass
+
+
+def test_system_actors_are_not_dispatched_update():
+    assert not hasattr(Recorder(), "on_update")
+
+
+def test_actors_tick_themselves_without_a_system():
+    scene = BaseScene()
+    actor = SelfTickingRecorder()
+    scene.add(actor)
+    alone, scheduled = Update(0.016, scene), Update(0.016, scene)
+
+    actor.on_update(alone, None)
+    bt_ppb.BehaviorSystem().on_update(scheduled, None)
+    actor.on_update(scheduled, None)
+
+    assert [event for _, event in actor.contexts] == [alone, scheduled]
+
+
+def test_context_is_dropped_with_its_scene():
+    system = bt_ppb.BehaviorSystem()
+    scene = BaseScene()
+    system.on_update(Update(0.016, scene), None)
+    left = weakref.ref(scene)
+
+    del scene
+    system.on_update(Update(0.016, BaseScene()), None)
+    gc.collect()
+    assert left() is None
+
+
+class TimeRecorder(bt_ppb.BehaviorMixin):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.deltas = []
+        self.behavior_tree = self.record
+
+    def record(self, actor, context):
+        self.deltas.append(round(context.event.time_delta, 6))
+        return State.SUCCESS
+
+
+def test_scheduler_ticks_by_distance():
+    scene = BaseScene()
+    near = TimeRecorder(position=(0, 0))
+    far = TimeRecorder(position=(0, 100))
+    fixed = TimeRecorder(position=(0, 100), behavior_interval=1)
+    for actor in (near, far, fixed):
+        scene.add(actor)
+    system = bt_ppb.BehaviorScheduler(lod_levels=[(10, 1), (inf, 3)])
+
+    for _ in range(6):
+        system.on_update(Update(0.1, scene), None)
+
+    assert near.deltas == [0.1] * 6
+    assert fixed.deltas == [0.1] * 6
+    assert far.deltas == [0.3, 0.3]
+
+
+def test_scheduler_defers_over_budget():
+    clock = FakeClock()
+    scene = BaseScene()
+    actors = [TimeRecorder() for _ in range(3)]
+    for actor in actors:
+        scene.add(actor)
+
+    def tick(actor, context):
+        clock.now += 1
+        actor.deltas.append(round(context.event.time_delta, 6))
+        return State.SUCCESS
+    for actor in actors:
+        actor.behavior_tree = tick
+    system = bt_ppb.BehaviorScheduler(budget=1.5, timer=clock)
+
+    for _ in range(3):
+        system.on_update(Update(0.1, scene), None)
+
+    assert sum(len(actor.deltas) for actor in actors) == 6
+    for actor in actors:
+        assert actor.deltas
+        assert round(sum(actor.deltas) + system.waiting[actor][0], 6) == 0.3
+
+
+def test_scheduler_never_defers_pinned_actors():
+    clock = FakeClock()
+    scene = BaseScene()
+    player = TimeRecorder(behavior_interval=1)
+    crowd = [TimeRecorder() for _ in range(3)]
+    for actor in (*crowd, player):
+        scene.add(actor)
+
+    def tick(actor, context):
+        clock.now += 1
+        actor.deltas.append(round(context.event.time_delta, 6))
+        return State.SUCCESS
+    for actor in (*crowd, player):
+        actor.behavior_tree = tick
+    system = bt_ppb.BehaviorScheduler(budget=.5, timer=clock)
+
+    for _ in range(3):
+        system.on_update(Update(0.1, scene), None)
+
+    assert player.deltas == [0.1] * 3
+    assert sum(len(actor.deltas) for actor in crowd) == 3
+
+
+def test_scheduler_queues_an_actor_once():
+    clock = FakeClock()
+    scene = BaseScene()
+    actors = [TimeRecorder() for _ in range(3)]
+    for actor in actors:
+        scene.add(actor)
+    system = bt_ppb.BehaviorScheduler(budget=0, timer=clock)
+    system.on_update(Update(0.1, scene), None)
+    returning = list(system.deferred)[-1]
+
+    scene.remove(returning)
+    system.on_update(Update(0.1, scene), None)
+    scene.add(returning)
+    system.budget = None
+    ticks = len(returning.deltas)
+    system.on_update(Update(0.1, scene), None)
+
+    assert len(returning.deltas) == ticks + 1
@@ -0,0 +1,43 @@
+from ppb.events import Update
+from ppb.systemslib import System
+
+from survival import simulate
+from survival.enemies import Enemy
+from survival.hitbox import PlayerHurtBox
+
+
+class Slasher(System):
+    """Puts a hurt box next to the first enemy a few frames in."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.frame = 0
+
+    def on_update(self, event: Update, _):
+        self.frame += 1
+        if self.frame == 10:
+            event.scene.add(PlayerHurtBox(position=(0, 1.5), intensity=2))
+
+
+def final_state():
+    engine = simulate(240, systems=[Slasher])
+    return [
+        (enemy.position, enemy.stunned, enemy.dead)
+        for enemy in engine.current_scene.get(kind=Enemy)
+    ]
+
+
+def test_simulate_advances_clock():
+    engine = simulate(30, time_step=0.1)
+    assert round(engine.clock.now, 6) == 3
+
+
+def test_engines_keep_their_own_time():
+    first = simulate(30, time_step=0.1)
+    second = simulate(10, time_step=0.1)
+    assert round(first.clock.now, 6) == 3
+    assert round(second.clock.now, 6) == 1
+
+
+def test_simulate_is_reproducible():
+    assert final_state() == final_state()
@@ -0,0 +1,60 @@
+from ppb import BaseScene
+from ppb import Sprite
+from ppb import Vector
+from ppb.events import PreRender
+
+from survival.events import IncreasedChargeLevel
+from survival.player import BTPlayer
+from survival.player import ChargeBox
+from survival.systems import Attached
+from survival.systems import AttachmentSystem
+
+
+class Pip(Attached, Sprite):
+    pass
+
+
+def test_charge_boxes_sit_behind_player():
+    scene = BaseScene()
+    player = BTPlayer(position=Vector(3, -2))
+    player.facing = Vector(1, 1).normalize()
+    scene.add(player)
+    boxes = [ChargeBox(parent=player, value=x) for x in range(1, 5)]
+    for box in boxes:
+        scene.add(box)
+
+    AttachmentSystem().on_pre_render(PreRender(scene=scene), None)
+
+    for box in boxes:
+        behind = player.facing * -0.8
+        home = behind.rotate(-90).scale(0.40)
+        expected = player.position + behind + (home * box.offsets[box.value - 1])
+        assert box.position.isclose(expected)
+        assert box.facing.isclose(player.facing)
+
+
+def test_charge_boxes_register_with_player():
+    player = BTPlayer()
+    boxes = [ChargeBox(parent=player, value=x) for x in range(1, 5)]
+
+    player.on_increased_charge_level(IncreasedChargeLevel(player, 2), None)
+
+    assert player.charge_boxes == boxes
+    assert [box.active for box in boxes] == [True, True, False, False]
+
+
+def test_vectorized_matches_scalar():
+    parents = [Sprite(position=Vector(x, x * 2)) for x in range(10)]
+    for index, parent in enumerate(parents):
+        parent.facing = Vector(1, 0).rotate(index * 37)
+    placed = {}
+    for vectorize_at in (1, 1000):
+        scene = BaseScene()
+        pips = [Pip(parent=parent, offset=Vector(0.5, -1.5)) for parent in parents]
+        for pip in pips:
+            scene.add(pip)
+        AttachmentSystem(vectorize_at=vectorize_at).on_pre_render(PreRender(scene=scene), None)
+        placed[vectorize_at] = [pip.position for pip in pips]
+
+    for vectorized, scalar in zip(placed[1], placed[1000]):
+        assert vectorized.isclose(scalar)
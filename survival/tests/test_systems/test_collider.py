@@ -1,3 +1,5 @@
+from random import Random
+
 from pytest import fixture
 from pytest import mark
 
@@ -8,6 +10,11 @@ from ppb import Vector
 from ppb.camera import Camera
 
 from survival.systems import Collider
+from survival.systems import SpatialHash
+from survival.systems import VectorizedCollider
+from survival.enemies import EnemySwarm
+from survival.systems.collider import does_collide_default
+from survival.systems.collider import pack_bounds
 
 
 class CollideCounter(Sprite):
@@ -162,3 +169,226 @@ def test_collider_on_idle_collisions(scene: CollisionsTestSceneOne, basic_collid
     for sprite, expect in scene.expect.items():
         assert sprite.collided_count == expect["count"], repr(sprite)
         assert sprite.collided_list == expect["sprites"], repr(sprite)
+
+
+class RecordingCollider(Collider):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.tested = []
+
+        def collides(left, right):
+            result = does_collide_default(left, right)
+            if result:
+                self.tested.append((left, right))
+            return result
+
+        self.collides = collides
+
+
+class SwarmScene(NeedsCollisionScene):
+    collision_pairs = [(Green, Blue), (Blue, Blue), (Green, Green)]
+
+    def __init__(self, seed):
+        super().__init__()
+        rng = Random(seed)
+        for kind in [Green, Blue] * 100:
+            self.add(kind(
+                position=Vector(rng.uniform(-40, 40), rng.uniform(-40, 40)),
+                size=rng.uniform(0.25, 4)
+            ))
+
+
+@mark.parametrize("scene_type", [CollisionsTestSceneOne, CollisionsTestSceneTwo])
+def test_spatial_hash_collisions(scene_type):
+    scene = scene_type()
+    collider = Collider(broad_phase=SpatialHash())
+    collider.running = True
+    collider.primed = True
+    collider.on_idle(events.Idle(0.01, scene), None)
+
+    sprite: CollideCounter
+    for sprite, expect in scene.expect.items():
+        assert sprite.collided_count == expect["count"], repr(sprite)
+        assert sprite.collided_list == expect["sprites"], repr(sprite)
+
+
+@mark.parametrize("seed", range(5))
+def test_spatial_hash_matches_brute_force(seed):
+    scene = SwarmScene(seed)
+    brute_force = RecordingCollider()
+    spatial_hash = RecordingCollider(broad_phase=SpatialHash())
+
+    brute_force.calculate_collision(scene)
+    spatial_hash.calculate_collision(scene)
+
+    assert brute_force.tested
+    assert spatial_hash.tested == brute_force.tested
+
+
+@mark.parametrize("scene_type", [CollisionsTestSceneOne, CollisionsTestSceneTwo])
+def test_vectorized_collisions(scene_type):
+    scene = scene_type()
+    collider = VectorizedCollider()
+    collider.running = True
+    collider.primed = True
+    collider.on_idle(events.Idle(0.01, scene), None)
+
+    sprite: CollideCounter
+    for sprite, expect in scene.expect.items():
+        assert sprite.collided_count == expect["count"], repr(sprite)
+        assert sprite.collided_list == expect["sprites"], repr(sprite)
+
+
+@mark.parametrize("seed", range(5))
+def test_vectorized_matches_brute_force(seed):
+    scene = SwarmScene(seed)
+    brute_force = Collider()
+    vectorized = VectorizedCollider()
+    vectorized.block_size = 64
+    greens = list(scene.get(kind=Green))
+    blues = list(scene.get(kind=Blue))
+
+    for left_group, right_group in [(greens, blues), (blues, blues)]:
+        expected = list(brute_force.find_collisions(left_group, right_group))
+        assert expected
+        assert list(vectorized.find_collisions(left_group, right_group)) == expected
+
+
+class ContactCounter(Sprite):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.received = []
+
+    def on_collision_started(self, event, signal):
+        self.received.append(("started", event.other))
+
+    def on_collision_ongoing(self, event, signal):
+        self.received.append(("ongoing", event.other))
+
+    def on_collision_ended(self, event, signal):
+        self.received.append(("ended", event.other))
+
+
+class ContactsScene(NeedsCollisionScene):
+    collision_pairs = [(ContactCounter, ContactCounter)]
+    track_contacts = True
+
+    def __init__(self):
+        super().__init__()
+        self.mover = ContactCounter(position=Vector(0, 0))
+        self.still = ContactCounter(position=Vector(0, 0.5))
+        self.add(self.mover)
+        self.add(self.still)
+
+
+def test_collider_contact_events(basic_collider: Collider):
+    scene = ContactsScene()
+    mover, still = scene.mover, scene.still
+
+    basic_collider.calculate_collision(scene)
+    assert mover.received == [("started", still)]
+    assert still.received == [("started", mover)]
+
+    basic_collider.calculate_collision(scene)
+    assert mover.received == [("started", still)], "Unmoved sprites should not be retested."
+
+    mover.position = Vector(0, 0.25)
+    basic_collider.calculate_collision(scene)
+    assert mover.received[-1] == ("ongoing", still)
+    assert still.received[-1] == ("ongoing", mover)
+
+    mover.position = Vector(10, 10)
+    basic_collider.calculate_collision(scene)
+    assert mover.received[-1] == ("ended", still)
+    assert still.received[-1] == ("ended", mover)
+
+    mover.position = Vector(0, 0)
+    basic_collider.calculate_collision(scene)
+    scene.remove(still)
+    basic_collider.calculate_collision(scene)
+    assert mover.received[-2:] == [("started", still), ("ended", still)]
+
+
+class FastCounter(CollideCounter):
+    size = 0.25
+    swept = True
+
+
+class TunnelScene(NeedsCollisionScene):
+    collision_pairs = [(FastCounter, Green)]
+
+    def __init__(self):
+        super().__init__()
+        self.bullet = FastCounter(position=Vector(-10, 0))
+        self.wall = Green(position=Vector(0, 0), size=1)
+        self.add(self.bullet)
+        self.add(self.wall)
+
+
+def test_swept_sprites_do_not_tunnel(basic_collider: Collider):
+    scene = TunnelScene()
+    basic_collider.calculate_collision(scene)
+    assert scene.bullet.collided_list == set()
+
+    scene.bullet.position = Vector(10, 0.5)
+    basic_collider.calculate_collision(scene)
+    assert scene.bullet.collided_list == {scene.wall}
+    assert scene.wall.collided_list == {scene.bullet}
+
+
+def test_swept_sprites_miss(basic_collider: Collider):
+    scene = TunnelScene()
+    basic_collider.calculate_collision(scene)
+
+    scene.bullet.position = Vector(10, 2)
+    basic_collider.calculate_collision(scene)
+    assert scene.bullet.collided_count == 0
+
+
+class ArcCounter(CollideCounter):
+    hit_shape = "arc"
+    pivot = Vector(0, 0)
+    direction = Vector(0, 1)
+    radius = 1
+    start_angle = 60
+    end_angle = 60
+
+
+class ArcScene(NeedsCollisionScene):
+    collision_pairs = [(ArcCounter, Green)]
+
+    def __init__(self):
+        super().__init__()
+        self.arc = ArcCounter()
+        self.ahead = Green(position=Vector(0, 1.5), size=0.5)
+        self.left = Green(position=Vector(-1.5, 0.5), size=0.5)
+        self.behind = Green(position=Vector(0, -1.5), size=0.5)
+        for sprite in (self.arc, self.ahead, self.left, self.behind):
+            self.add(sprite)
+
+
+def test_arc_collisions(basic_collider: Collider):
+    scene = ArcScene()
+    basic_collider.calculate_collision(scene)
+    assert scene.arc.collided_list == {scene.left}
+
+    scene.arc.end_angle = -20
+    basic_collider.calculate_collision(scene)
+    assert scene.arc.collided_list == {scene.left, scene.ahead}
+    assert scene.behind.collided_count == 0
+
+
+def test_pack_bounds_reads_swarms_directly():
+    swarm = EnemySwarm()
+    handles = [swarm.spawn(position=Vector(x, -x)) for x in range(4)]
+    swarm.remove(handles[1])  # Moves the last member into its slot.
+    handles[2].position = Vector(7, 7)
+    group = [Sprite(position=Vector(2, 3), size=2), *handles]
+
+    bounds = pack_bounds(group)
+
+    for column, sprite in enumerate(group):
+        expected = [sprite.left, sprite.right, sprite.top, sprite.bottom, sprite.size]
+        assert bounds[:, column].tolist() == expected
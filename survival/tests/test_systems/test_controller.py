@@ -0,0 +1,49 @@
+import pytest
+from ppb import keycodes as key
+from ppb import events as ppb_events
+
+from survival.systems import Controller
+from survival.systems import Controls
+
+
+class FakeEngine:
+
+    def __init__(self):
+        self.extensions = {}
+
+    def register(self, event_type, callback):
+        self.extensions[event_type] = callback
+
+    def publish(self, event):
+        if type(event) in self.extensions:
+            self.extensions[type(event)](event)
+        return event
+
+
+def test_controls_are_immutable():
+    controls = Controls(walk=None, slash=False, shoot=False, dash=False)
+    with pytest.raises(AttributeError):
+        controls.slash = True
+
+
+def test_controls_are_shared_until_input_changes():
+    engine = FakeEngine()
+    controller = Controller(engine=engine)
+
+    first = engine.publish(ppb_events.Update(1 / 60)).controls
+    second = engine.publish(ppb_events.Update(1 / 60)).controls
+    assert first is second
+
+    controller.on_key_pressed(ppb_events.KeyPressed(key=key.A, mods=set()), None)
+    third = engine.publish(ppb_events.Update(1 / 60)).controls
+    assert third is not second
+    assert third.walk == (-1, 0)
+
+    controller.on_key_pressed(ppb_events.KeyPressed(key=key.Q, mods=set()), None)
+    assert engine.publish(ppb_events.Update(1 / 60)).controls is third
+
+
+def test_controls_only_on_consuming_events():
+    engine = FakeEngine()
+    Controller(engine=engine)
+    assert not hasattr(engine.publish(ppb_events.Idle(1 / 60)), "controls")
@@ -0,0 +1,67 @@
+from ppb import events
+from ppb import Sprite
+from ppb import Vector
+
+from survival.systems import Pooled
+from survival.systems import Recycler
+from survival.systems.pooling import Pool
+from survival.systems.pooling import get_pool
+from survival.systems.pooling import pools
+
+
+class Pellet(Pooled, Sprite):
+    pool_capacity = 2
+    hits = 0
+
+
+def test_pool_preallocates():
+    pool = Pool(Pellet, 3)
+    assert pool.stats.free == 3
+
+
+def test_pool_hits_and_misses():
+    pool = Pool(Pellet, 1)
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert first is not second
+    assert pool.stats.hits == 1
+    assert pool.stats.misses == 1
+
+
+def test_pool_resets_state():
+    pool = Pool(Pellet)
+    pellet = pool.acquire(position=Vector(3, 4))
+    pellet.hits = 5
+    pool.release(pellet)
+    pool.recycle()
+
+    reused = pool.acquire(position=Vector(1, 1))
+    assert reused is pellet
+    assert reused.position == Vector(1, 1)
+    assert reused.hits == 0
+
+
+def test_released_wait_for_recycle():
+    pellet = Pellet.acquire()
+    pool = get_pool(Pellet)
+    free = pool.stats.free
+    pellet.release()
+
+    assert pool.stats.free == free
+    assert pool.stats.waiting == 1
+
+    Recycler().on_idle(events.Idle(0.01), None)
+    assert pool.stats.free == free + 1
+    assert pool.stats.waiting == 0
+
+
+def test_pools_are_scoped_to_the_engine():
+    leftover = Pellet.acquire()
+    leftover.release()
+
+    with Recycler():
+        assert not pools
+        fresh = Pellet.acquire()
+        assert fresh is not leftover
+    assert not pools
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+from ppb.errors import BadEventHandlerException
+from ppb.systemslib import System
+
+from survival import simulate
+from survival.systems import Profiler
+
+
+def profiler_of(engine):
+    return next(system for system in engine.systems if isinstance(system, Profiler))
+
+
+def test_records_handlers_per_frame(tmp_path):
+    path = tmp_path / "trace.json"
+    engine = simulate(30, systems=[Profiler], profile_frames=10, trace_to=str(path))
+    profiler = profiler_of(engine)
+
+    assert len(profiler.frames) == 10
+    totals = profiler.frames[-1].totals()
+    assert totals["Collider.on_idle"][1] == 1
+    assert totals["BehaviorScheduler.on_update"][1] == 1
+    assert "Sandbox.on_update" in profiler.summary(count=50)
+
+    trace = json.loads(path.read_text())
+    names = {event["name"] for event in trace["traceEvents"]}
+    assert "Collider.on_idle" in names
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
+
+
+def test_disabled_leaves_dispatch_alone():
+    engine = simulate(5, systems=[Profiler], profile=False)
+    profiler = profiler_of(engine)
+    assert not profiler.frames
+    assert "publish" not in engine.__dict__
+    assert "walk" not in engine.__dict__
+
+
+def test_stopping_unwraps_extensions():
+    engine = simulate(5, systems=[Profiler])
+    callbacks = [callback for extensions in engine.event_extensions.values() for callback in extensions]
+    assert callbacks
+    assert not any(hasattr(callback, "profiled") for callback in callbacks)
+
+
+class Broken(System):
+    def on_update(self, event):
+        pass
+
+
+def test_bad_handlers_still_raise():
+    with pytest.raises(BadEventHandlerException):
+        simulate(5, systems=[Profiler, Broken])
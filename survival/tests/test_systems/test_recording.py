@@ -0,0 +1,63 @@
+import io
+import random
+
+from ppb import buttons as button
+from ppb import events as ppb_events
+from ppb import keycodes as key
+
+from survival import simulate
+from survival.batch import ScriptedInput
+from survival.enemies import Enemy
+from survival.player import BTPlayer
+from survival.systems import ControlsRecorder
+from survival.systems import ReplayController
+from survival.systems.recording import ControlsReader
+from survival.systems.recording import ControlsState
+from survival.systems.recording import ControlsWriter
+
+
+def test_round_trip():
+    rng = random.Random(5)
+    states = [
+        ControlsState(rng.randint(-4, 4), rng.randint(-1, 1), *(rng.random() < .5 for _ in range(3)))
+        for _ in range(500)
+    ]
+    file = io.BytesIO()
+    writer = ControlsWriter(file, time_step=1 / 60)
+    for state in states:
+        writer.write(state)
+
+    file.seek(0)
+    reader = ControlsReader(file)
+    assert reader.time_step == 1 / 60
+    assert list(reader) == states
+
+
+def test_one_byte_per_small_step():
+    file = io.BytesIO()
+    writer = ControlsWriter(file)
+    start = file.tell()
+    for walk in [(0, 0), (1, 0), (1, 1), (-1, -1), (0, 0)]:
+        writer.write(ControlsState(*walk, True, False, True))
+    assert file.tell() - start == 5
+
+
+def final_state(engine):
+    scene = engine.current_scene
+    player = next(scene.get(kind=BTPlayer))
+    return player.position, [(enemy.position, enemy.dead) for enemy in scene.get(kind=Enemy)]
+
+
+def test_replay_matches_recording(tmp_path):
+    path = str(tmp_path / "session.controls")
+    script = {
+        0: [ppb_events.KeyPressed(key=key.W, mods=set())],
+        20: [ppb_events.ButtonPressed(button=button.Primary, position=None)],
+        50: [ppb_events.ButtonReleased(button=button.Primary, position=None)],
+        60: [ppb_events.KeyPressed(key=key.D, mods=set())],
+        90: [ppb_events.KeyReleased(key=key.W, mods=set())],
+    }
+    recorded = simulate(120, systems=[ScriptedInput, ControlsRecorder], script=script, record_to=path)
+    replayed = simulate(None, controller=ReplayController, replay_from=path)
+
+    assert final_state(replayed) == final_state(recorded)
@@ -0,0 +1,154 @@
+from types import SimpleNamespace
+
+import pytest
+from misbehave.common import State
+from ppb import Vector
+from ppb.events import Update
+
+from survival import utils
+from survival.actions import DashMove
+from survival.hitbox import SlashArc
+from survival.systems import ClockSystem
+from survival.systems import Recycler
+from survival.systems import TweenSystem
+from survival.systems import clock
+from survival.systems import current_clock
+from survival.systems import tweens
+from survival.systems.tweening import Tweens
+
+
+def test_matches_per_actor_easing():
+    tweens = Tweens(capacity=1)
+    actors = [SimpleNamespace() for _ in range(3)]
+    tweens.add(actors[0], "position", Vector(1, 1), Vector(4, -2), 2, curve="ease_out", began=0)
+    tweens.add(actors[1], "angle", 60, -80, 1, curve="ease_in", began=.5)
+    tweens.add(actors[2], "size", 1, 1, 4, began=0)
+
+    tweens.step(.75)
+
+    assert actors[0].position.isclose(Vector(1, 1) + Vector(4, -2) * utils.quadratic_ease_out(.75, 0, 1, 2))
+    assert actors[1].angle == pytest.approx(utils.quadratic_ease_in(.25, 60, -80, 1))
+    assert actors[2].size == pytest.approx(1.1875)
+
+
+def test_finished_tweens_land_on_the_end_and_call_back():
+    tweens = Tweens()
+    actor = SimpleNamespace()
+    done = []
+    short = tweens.add(actor, "x", 0, 10, 1, on_done=lambda: done.append("short"), began=0)
+    long = tweens.add(actor, "y", 0, 10, 2, on_done=lambda: done.append("long"), began=0)
+
+    tweens.step(1.5)
+
+    assert (actor.x, done) == (10, ["short"])
+    assert not tweens.active(short)
+    assert tweens.active(long)
+    assert len(tweens) == 1
+
+
+def test_cancel_drops_a_targets_tweens():
+    tweens = Tweens()
+    kept, cancelled = SimpleNamespace(), SimpleNamespace()
+    for actor in (cancelled, kept, cancelled):
+        tweens.add(actor, "x", 0, 1, 1, began=0)
+
+    tweens.cancel(cancelled)
+    tweens.step(.5)
+
+    assert len(tweens) == 1
+    assert kept.x == .5
+    assert not hasattr(cancelled, "x")
+
+
+@pytest.fixture
+def step_frame():
+    """
+    Runs ClockSystem and TweenSystem by hand, one Update per call.
+    """
+    systems = [ClockSystem(), TweenSystem(), Recycler()]
+    for system in systems:
+        system.__enter__()
+
+    def step_frame(time_delta=1 / 60):
+        update = Update(time_delta)
+        for system in systems[:2]:
+            system.on_update(update, None)
+        systems[2].on_idle(None, None)
+    yield step_frame
+    for system in reversed(systems):
+        system.__exit__(None, None, None)
+
+
+def dashing_actor():
+    return SimpleNamespace(
+        position=Vector(0, 0),
+        dash_start_position=Vector(0, 0),
+        position_change=Vector(0, 3),
+        dash_start=clock()
+    )
+
+
+def test_dash_moves_through_tween_system(step_frame):
+    actor = dashing_actor()
+    dash = DashMove("dash_start")
+
+    assert dash(actor, None) is State.RUNNING
+    step_frame(.125)
+    assert dash(actor, None) is State.RUNNING
+    assert actor.position.isclose(Vector(0, utils.quadratic_ease_out(.125, 0, 3, .25)))
+    step_frame(.125)
+
+    assert dash(actor, None) is State.SUCCESS
+    assert actor.position == Vector(0, 3)
+    assert not len(tweens)
+
+
+def test_dash_reset_stops_moving_the_actor(step_frame):
+    actor = dashing_actor()
+    dash = DashMove("dash_start")
+    dash(actor, None)
+    step_frame(.125)
+
+    dash.reset(actor)
+    stopped_at = actor.position
+    step_frame(.125)
+
+    assert actor.position == stopped_at
+    assert not len(tweens)
+
+
+def test_dash_ends_without_tween_system():
+    tweens.clear()
+    actor = dashing_actor()
+    dash = DashMove("dash_start")
+    dash(actor, None)
+    current_clock().advance(.25)
+
+    assert dash(actor, None) is State.SUCCESS
+    assert actor.position == Vector(0, 3)
+    assert not len(tweens)
+
+
+def test_only_acquired_arcs_sweep(step_frame):
+    arc = SlashArc.acquire(pivot=Vector(0, 0), direction=Vector(0, 1))
+    assert len(tweens) == 2
+
+    step_frame(.096)
+    expected = utils.quadratic_ease_in(.096, arc.initial_rotation, arc.change_in_rotation, arc.sweep_time)
+    assert arc.end_angle == pytest.approx(expected)
+    assert arc.start_angle == arc.initial_rotation
+
+    arc.release()
+    step_frame()
+    again = SlashArc.acquire(pivot=Vector(0, 0), direction=Vector(0, 1))
+    assert again is arc
+    assert len(tweens) == 2
+
+
+def test_tweens_are_scoped_to_the_engine():
+    tweens.add(SimpleNamespace(), "x", 0, 1, 1, began=0)
+
+    with TweenSystem():
+        assert not len(tweens)
+        tweens.add(SimpleNamespace(), "x", 0, 1, 1, began=0)
+    assert not len(tweens)
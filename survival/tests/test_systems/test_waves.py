@@ -0,0 +1,65 @@
+from math import hypot
+
+from ppb import BaseScene
+from ppb import Vector
+from ppb.events import Update
+
+from survival.systems import Wave
+from survival.systems import WaveSpawner
+from survival.systems.waves import escalating_waves
+
+
+class WaveScene(BaseScene):
+    waves = [Wave(10, 0), Wave(100, 1)]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.spawned = []
+
+    def spawn_enemy(self, position):
+        self.spawned.append(position)
+
+
+def step(spawner, scene, frames, time_delta=.25):
+    counts = []
+    for _ in range(frames):
+        before = len(scene.spawned)
+        spawner.on_update(Update(time_delta, scene), None)
+        counts.append(len(scene.spawned) - before)
+    return counts
+
+
+def test_escalating_waves():
+    assert escalating_waves(first=4, growth=2, interval=10, waves=3) == [Wave(4, 0), Wave(8, 10), Wave(16, 20)]
+
+
+def test_spawns_are_spread_across_frames():
+    scene = WaveScene()
+    spawner = WaveSpawner(spawn_limit=32, spawn_budget=None)
+
+    counts = step(spawner, scene, 10)
+
+    assert counts == [10, 0, 0, 32, 32, 32, 4, 0, 0, 0]
+
+
+def test_time_budget_caps_a_frame():
+    scene = WaveScene()
+    ticks = iter(range(1000))
+    spawner = WaveSpawner(spawn_limit=32, spawn_budget=3, timer=lambda: next(ticks))
+
+    assert step(spawner, scene, 2) == [3, 3]
+
+
+def test_spawns_off_screen():
+    scene = WaveScene()
+    camera = scene.main_camera
+    camera.position = Vector(40, -10)
+    spawner = WaveSpawner(spawn_budget=None)
+
+    step(spawner, scene, 20)
+
+    assert len(scene.spawned) == 110
+    for position in scene.spawned:
+        assert not (camera.frame_left <= position.x <= camera.frame_right
+                    and camera.frame_bottom <= position.y <= camera.frame_top)
+        assert hypot(*(position - camera.position)) < 20
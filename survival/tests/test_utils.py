@@ -0,0 +1,71 @@
+import pytest
+from ppb import Vector
+
+from survival import utils
+
+
+@pytest.fixture
+def vectors_made(monkeypatch):
+    """
+    Counts every Vector built, including the ones inside Vector's own methods.
+    """
+    made = []
+    new = Vector.__new__
+
+    def counting_new(cls, *args, **kwargs):
+        made.append(args)
+        return new(cls, *args, **kwargs)
+    monkeypatch.setattr(Vector, "__new__", counting_new)
+    return made
+
+
+@pytest.mark.parametrize("chained, fused", [
+    (
+        lambda a, b: a + (b - a).scale_to(2),
+        lambda a, b: utils.move_toward(a, b, 2),
+    ),
+    (
+        lambda a, b: (a * .9 + b * .1).normalize(),
+        lambda a, b: utils.lerp_direction(a, b, .1),
+    ),
+    (
+        lambda a, b: a + b * .5,
+        lambda a, b: utils.advance(a, b, .5),
+    ),
+    (
+        lambda a, b: a + b.scale(3),
+        lambda a, b: utils.move_along(a, b, 3),
+    ),
+    (
+        lambda a, b: a + b.rotate(-20).scale_to(1.5),
+        lambda a, b: utils.orbit(a, b, -20, 1.5),
+    ),
+])
+def test_fused_matches_chained_with_one_vector(vectors_made, chained, fused):
+    first, second = Vector(1, 2), Vector(-4, 7)
+
+    vectors_made.clear()
+    expected = chained(first, second)
+    chained_count = len(vectors_made)
+    vectors_made.clear()
+    result = fused(first, second)
+    fused_count = len(vectors_made)
+
+    assert fused_count == 1 < chained_count
+    assert result.isclose(expected)
+
+
+def test_helpers_take_tuples():
+    assert utils.move_toward((0, 0), (3, 4), 10) == Vector(3, 4)
+    assert utils.lerp((0, 0), (10, -10), .25) == Vector(2.5, -2.5)
+    assert utils.distance((1, 1), (4, 5)) == 5
+
+
+def test_asymptotic_average_takes_scalars():
+    assert utils.asymptotic_average_builder(25)(4, 8) == 5
+
+
+def test_lerp_builder_matches_asymptotic_average():
+    old, new = Vector(1, 2), Vector(-4, 7)
+    expected = utils.asymptotic_average_builder(5)(old, new)
+    assert utils.lerp_builder(5)(old, new).isclose(expected)
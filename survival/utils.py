@@ -1,5 +1,16 @@
+from math import cos
+from math import hypot
+from math import radians
+from math import sin
+from typing import Callable
+from typing import Sequence
 from typing import Union
 
+from ppb import Vector
+
+# Anything with an x and a y that unpacks: a Vector, a tuple, a numpy row.
+Pair = Sequence[float]
+
 
 def asymptotic_average_builder(new_part: Union[float, int]):
     """
@@ -31,3 +42,102 @@ def quadratic_ease_in(run_time, start, change, duration):
 def quadratic_ease_out(run_time, start, change, duration):
     run_time /= duration
     return -change * run_time * (run_time - 2) + start
+
+
+# The helpers below fuse chains of Vector operations. They work on plain
+# floats and build a single Vector for the result, where the chained form
+# makes a new Vector at every step.
+
+
+def lerp(old: Pair, new: Pair, amount: float) -> Vector:
+    """
+    The point amount of the way from old to new.
+    """
+    old_x, old_y = old
+    new_x, new_y = new
+    return Vector(old_x + (new_x - old_x) * amount, old_y + (new_y - old_y) * amount)
+
+
+def lerp_builder(new_part: Union[float, int]) -> Callable[[Pair, Pair], Vector]:
+    """
+    asymptotic_average_builder for pairs, using lerp.
+
+    :param new_part: The percentage of the new value to use.
+    """
+    amount = new_part / 100.0
+
+    def interpolate(old_input: Pair, new_input: Pair) -> Vector:
+        return lerp(old_input, new_input, amount)
+
+    return interpolate
+
+
+def lerp_direction(old: Pair, new: Pair, amount: float) -> Vector:
+    """
+    lerp between two directions, normalized.
+
+    Returns old unchanged if the blend cancels out.
+    """
+    old_x, old_y = old
+    new_x, new_y = new
+    x = old_x + (new_x - old_x) * amount
+    y = old_y + (new_y - old_y) * amount
+    length = hypot(x, y)
+    if not length:
+        return Vector(old_x, old_y)
+    return Vector(x / length, y / length)
+
+
+def advance(position: Pair, direction: Pair, distance: float) -> Vector:
+    """
+    position + direction * distance.
+    """
+    x, y = position
+    direction_x, direction_y = direction
+    return Vector(x + direction_x * distance, y + direction_y * distance)
+
+
+def move_along(position: Pair, direction: Pair, distance: float) -> Vector:
+    """
+    Step distance from position in direction, whatever its length.
+    """
+    x, y = position
+    direction_x, direction_y = direction
+    step = distance / hypot(direction_x, direction_y)
+    return Vector(x + direction_x * step, y + direction_y * step)
+
+
+def move_toward(position: Pair, target: Pair, distance: float) -> Vector:
+    """
+    Step distance from position toward target, stopping on it.
+    """
+    x, y = position
+    target_x, target_y = target
+    offset_x = target_x - x
+    offset_y = target_y - y
+    remaining = hypot(offset_x, offset_y)
+    if remaining <= distance:
+        return Vector(target_x, target_y)
+    step = distance / remaining
+    return Vector(x + offset_x * step, y + offset_y * step)
+
+
+def orbit(center: Pair, direction: Pair, angle: float, radius: float) -> Vector:
+    """
+    center + direction.rotate(angle).scale_to(radius).
+    """
+    x, y = center
+    direction_x, direction_y = direction
+    angle = radians(angle)
+    angle_cos, angle_sin = cos(angle), sin(angle)
+    scale = radius / hypot(direction_x, direction_y)
+    return Vector(
+        x + (direction_x * angle_cos - direction_y * angle_sin) * scale,
+        y + (direction_x * angle_sin + direction_y * angle_cos) * scale
+    )
+
+
+def distance(first: Pair, second: Pair) -> float:
+    first_x, first_y = first
+    second_x, second_y = second
+    return hypot(second_x - first_x, second_y - first_y)